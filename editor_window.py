@@ -23,34 +23,117 @@ This module implements the main editor window functionality, providing features
 import os
 import sys
 import re
+import glob
+import html
 import json
+import mmap
+import bisect
 import shutil
+import time
+import hashlib
+import sqlite3
+import functools
 import logging
+from array import array
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, List, Dict, Union, Tuple
+from enum import IntEnum
+from typing import Optional, List, Dict, Union, Tuple, Set, Any, Callable
 from bs4 import BeautifulSoup
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
-    QFrame, QToolBar, QTextEdit, QMenuBar, QMenu, QStatusBar,
+    QFrame, QToolBar, QTextEdit, QPlainTextEdit, QMenuBar, QMenu, QStatusBar,
     QFileDialog, QMessageBox, QDockWidget, QTreeView, QTabWidget,
     QInputDialog, QLineEdit, QProgressDialog, QLabel, QComboBox,
     QCheckBox, QPushButton, QFontComboBox, QSpinBox,
-    QToolButton, QScrollArea, QProgressBar, QApplication, QDialog
+    QToolButton, QScrollArea, QProgressBar, QApplication, QDialog,
+    QListView
 )
 
 from PyQt6.QtCore import (
     Qt, pyqtSignal, QDir, QTimer, QEvent, QSize, QPoint, QUrl, QFile,
-    QTextStream, QByteArray, QSettings, QRect, QThread
+    QTextStream, QByteArray, QSettings, QRect, QThread, QObject,
+    QRunnable, QThreadPool, QFileSystemWatcher, QAbstractListModel,
+    QModelIndex
 )
 
 from PyQt6.QtGui import (
     QAction, QIcon, QKeySequence, QFontDatabase, QTextCharFormat,
-    QColor, QPalette, QTextCursor, QTextDocument, QTextBlockFormat,
-    QSyntaxHighlighter, QFont, QFontMetrics, QActionGroup, QClipboard
+    QColor, QTextCursor, QTextDocument, QTextBlockFormat, QTextFormat,
+    QSyntaxHighlighter, QFont, QFontMetrics, QActionGroup, QClipboard,
+    QPainter, QPixmap, QPolygon, QPaintEvent, QMouseEvent, QStandardItem,
+    QStandardItemModel, QCursor
 )
 
+# Use orjson for macro storage when available, falling back to json
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# Keep bookmarks ordered with sortedcontainers when available,
+# falling back to a bisect-maintained list
+try:
+    from sortedcontainers import SortedList
+
+    HAS_SORTEDCONTAINERS = True
+except ImportError:
+    HAS_SORTEDCONTAINERS = False
+
+    class SortedList(list):
+        """Minimal bisect-backed stand-in for sortedcontainers.SortedList"""
+
+        def __init__(self, iterable=()):
+            super().__init__(sorted(iterable))
+
+        def add(self, value):
+            bisect.insort(self, value)
+
+        def discard(self, value):
+            index = bisect.bisect_left(self, value)
+            if index < len(self) and self[index] == value:
+                del self[index]
+
+        def bisect_left(self, value) -> int:
+            return bisect.bisect_left(self, value)
+
+        def bisect_right(self, value) -> int:
+            return bisect.bisect_right(self, value)
+
+        def __contains__(self, value) -> bool:
+            index = bisect.bisect_left(self, value)
+            return index < len(self) and self[index] == value
+
+
+class BookmarkArray(array):
+    """Sorted array('i') of bookmarked lines with the SortedList API used here"""
+
+    def __new__(cls, iterable=()):
+        return super().__new__(cls, 'i', sorted(iterable))
+
+    def add(self, value):
+        bisect.insort(self, value)
+
+    def discard(self, value):
+        index = bisect.bisect_left(self, value)
+        if index < len(self) and self[index] == value:
+            del self[index]
+
+    def bisect_left(self, value) -> int:
+        return bisect.bisect_left(self, value)
+
+    def bisect_right(self, value) -> int:
+        return bisect.bisect_right(self, value)
+
+    def __contains__(self, value) -> bool:
+        index = bisect.bisect_left(self, value)
+        return index < len(self) and self[index] == value
+
 # Try to import WebEngine components, but don't fail if not available
 try:
     from PyQt6.QtWebEngineWidgets import QWebEngineView
@@ -83,6 +166,155 @@ except ImportError:
     MAX_RECENT_FILES = 10
     DEFAULT_FONT_FAMILY = "Source Code Pro"
     DEFAULT_FONT_SIZE = 12
+    MACRO_BACKUP_COUNT = 3
+    MINIMAP_THROTTLE_INTERVAL = 0.042  # seconds, ~24 fps
+    MINIMAP_UPDATE_DELAY = 75  # ms, coalesces bursts of edits/scrolls
+    LSP_CHANGE_DELAY = 150  # ms, only the last edit of a burst reaches the server
+    BOOKMARK_ARRAY_THRESHOLD = 256  # per-file bookmarks kept as array('i') above this
+    FOLDING_UPDATE_INTERVAL = 0.5  # seconds
+
+    # Git line indicator backgrounds
+    _GIT_SEL_COLORS = {
+        'added': QColor("#e6ffe6"),  # Light green
+        'modified': QColor("#fff5e6"),  # Light orange
+        'deleted': QColor("#ffe6e6")  # Light red
+    }
+    _GIT_SEL_DEFAULT = QColor("#f0f0f0")
+
+    # Unified diff line patterns used by format_diff_content
+    _DIFF_ADD = re.compile(r'^\+[^\n]*', re.MULTILINE)
+    _DIFF_DEL = re.compile(r'^-[^\n]*', re.MULTILINE)
+    _DIFF_HDR = re.compile(r'^@@[^\n]*', re.MULTILINE)
+    _DIFF_STYLE = (
+        "<style>"
+        "pre { margin: 0; }"
+        ".added { background-color: #e6ffe6; color: #28a745; }"
+        ".deleted { background-color: #ffe6e6; color: #dc3545; }"
+        ".hunk { color: #6c757d; }"
+        "</style>"
+    )
+
+    # Analysis marker appearance per severity
+    SEVERITY_COLORS = {
+        'error': QColor("#ff0000"),
+        'warning': QColor("#ffa500"),
+        'info': QColor("#0000ff")
+    }
+    SEVERITY_STYLES = {
+        'error': Qt.PenStyle.SolidLine,
+        'warning': Qt.PenStyle.DashLine,
+        'info': Qt.PenStyle.DotLine
+    }
+    _DEFAULT_SEVERITY_COLOR = QColor("#000000")
+
+    # Display order of analysis results; unknown severities sort last
+    _SEVERITY_RANK = {'error': 0, 'warning': 1, 'info': 2}
+    _SEV_GET = _SEVERITY_RANK.get
+
+    # Tooltip prefixes for analysis markers
+    _SEV_PREFIX = {'error': 'ERROR: ', 'warning': 'WARNING: ', 'info': 'INFO: '}
+
+    # Prebuilt analysis status label stylesheets
+    _STATUS_STYLES = {
+        color: f"color: {color}; font-weight: bold;"
+        for color in ("#ff0000", "#ffa500", "#0000ff", "#00aa00")
+    }
+
+    # ASCII classification for completion triggers:
+    # 1 = trigger character, 2 = identifier character, 0 = neither
+    _TRIGGER_TABLE = bytes(
+        1 if chr(i) in '.:(<"\'' else
+        2 if chr(i).isalnum() or chr(i) == '_' else 0
+        for i in range(128)
+    )
+
+    # Characters that fire a completion request on textChanged
+    _TRIGGER_CHARS = frozenset('._:>')
+
+    class Kind(IntEnum):
+        """Completion kinds; the value doubles as the sort priority"""
+        Variable = 0
+        Function = 1
+        Class = 2
+        Method = 3
+        Property = 4
+        Field = 5
+        Interface = 6
+        Module = 7
+        Keyword = 8
+        Snippet = 9
+        Unknown = 10
+
+
+    # Resolved once per suggestion when results arrive, see CompletionWorker
+    _KIND_LOOKUP = {kind.name: kind for kind in Kind if kind is not Kind.Unknown}
+
+
+    def _suggestion_kind(suggestion: Dict[str, Any]) -> Kind:
+        """Kind of a suggestion, resolved from 'kind' if the worker did not"""
+        kind = suggestion.get('_kind_int')
+        if kind is None:
+            kind = _KIND_LOOKUP.get(suggestion.get('kind', ''), Kind.Unknown)
+        return kind
+
+
+    # Icon file per Kind, indexed by value
+    _KIND_ICONS = (
+        'variable.png',
+        'function.png',
+        'class.png',
+        'method.png',
+        'property.png',
+        'field.png',
+        'interface.png',
+        'module.png',
+        'keyword.png',
+        'snippet.png',
+        'default.png'
+    )
+
+    # Languages with completion/analysis providers, in provider-list order
+    LANGUAGES = ('python', 'javascript', 'typescript', 'java', 'cpp', 'go')
+    LANG_INDEX = {sys.intern(name): i for i, name in enumerate(LANGUAGES)}
+
+    # Fields every stored macro must define
+    _MACRO_REQUIRED_FIELDS = frozenset(('actions', 'created', 'modified'))
+
+    # Line starts that carry non-whitespace text (snippet re-indentation)
+    _INDENT_RE = re.compile(r'\n(?=[^\S\n]*\S)')
+
+    # Lines that can start a fold, as one alternation
+    _FOLD_START_RE = re.compile(
+        r'\s*(?:'
+        r'(?:class|def)\s+\w+.*:\s*$'  # Python class/function
+        r'|(?:if|for|while|try).*:\s*$'  # Python control structures
+        r'|\{\s*$'  # Curly brace languages
+        r'|//\s*region\b'  # C# region
+        r'|/\*'  # Multi-line comment start
+        r'|<!--'  # HTML comment start
+        r')'
+    )
+
+    # First non-blank characters any _FOLD_START_RE match can begin with
+    _FOLD_START_CHARS = frozenset('cdiftw{/<')
+
+    # Marks the temporary current-line flash among an editor's extra selections
+    _LINE_FLASH_PROPERTY = int(QTextFormat.Property.UserProperty) + 1
+
+    # Marks analysis diagnostics among an editor's extra selections
+    _ANALYSIS_PROPERTY = int(QTextFormat.Property.UserProperty) + 2
+
+    # Shared QIcon instances, keyed by resource path
+    _ICON_CACHE: Dict[str, QIcon] = {}
+
+
+    def _icon(path: str) -> QIcon:
+        """Return a cached QIcon for a resource path"""
+        icon = _ICON_CACHE.get(path)
+        if icon is None:
+            icon = _ICON_CACHE[path] = QIcon(path)
+        return icon
+
 
     # Create logs directory if it doesn't exist
     try:
@@ -111,6 +343,33 @@ except ImportError:
         logger = logging.getLogger(__name__)
 
 
+    @functools.lru_cache(maxsize=32)
+    def _load_icon(resources_dir: str, kind: Kind) -> QIcon:
+        """Load the completion icon for a kind; shared between popups"""
+        icon_path = os.path.join(resources_dir, 'icons', _KIND_ICONS[kind])
+
+        if os.path.exists(icon_path):
+            return QIcon(icon_path)
+
+        return QIcon()
+
+
+    def _with_analysis_selections(editor: QTextEdit, selections: List) -> List:
+        """Append an editor's analysis marker selections to selections"""
+        return selections + getattr(editor, '_analysis_selections', [])
+
+
+    def _changed_text(document: QTextDocument, position: int, added: int) -> str:
+        """Return the text inserted by a contentsChange(position, _, added)"""
+        # A whole-document replace reports the final paragraph separator,
+        # which is not a valid cursor position
+        end = min(position + added, document.characterCount() - 1)
+        cursor = QTextCursor(document)
+        cursor.setPosition(position)
+        cursor.setPosition(end, QTextCursor.MoveMode.KeepAnchor)
+        return cursor.selectedText().replace('\u2029', '\n')
+
+
     class EditorWindow(QMainWindow):
         """
         Main editor window class implementing HTML editing functionality
@@ -126,6 +385,9 @@ except ImportError:
         cursorPositionChanged = pyqtSignal(int, int)
         selectionChanged = pyqtSignal(bool)
         themeChanged = pyqtSignal(str)
+        completionRequested = pyqtSignal(int, int, int, str, int)
+        completionDocumentOpened = pyqtSignal(str, int, str)
+        completionDocumentChanged = pyqtSignal(str, int, int, int, str)
 
         def __init__(self, parent=None):
             """Initialize the editor window with all required components"""
@@ -145,6 +407,7 @@ except ImportError:
                 self.search_state = {}
                 self.git_config = {}
                 self.completion_settings = {}
+                self._current_editor_cache = None
 
                 # Initialize managers
                 self.initialize_managers()
@@ -228,23 +491,30 @@ except ImportError:
                 self.logger.error(f"[{CURRENT_TIMESTAMP}] Error loading configuration: {str(e)}")
                 raise
 
-        def current_editor(self) -> Optional[QTextEdit]:
+        def current_editor(self) -> Optional[QPlainTextEdit]:
             """Get the currently active editor widget"""
             try:
-                current_tab = self.tab_widget.currentWidget()
-                if isinstance(current_tab, QTextEdit):
-                    return current_tab
-                return None
+                # Resolved once per tab switch; see invalidate_current_editor
+                editor = self._current_editor_cache
+                if editor is None:
+                    current_tab = self.tab_widget.currentWidget()
+                    if isinstance(current_tab, QPlainTextEdit):
+                        editor = self._current_editor_cache = current_tab
+                return editor
 
             except Exception as e:
                 self.logger.error(f"[{CURRENT_TIMESTAMP}] Error getting current editor: {str(e)}")
                 return None
 
-        def new_file(self) -> Optional[QTextEdit]:
+        def invalidate_current_editor(self, index: int = -1):
+            """Drop the cached current editor after the active tab changes"""
+            self._current_editor_cache = None
+
+        def new_file(self) -> Optional[QPlainTextEdit]:
             """Create a new file tab"""
             try:
                 # Create new editor
-                editor = QTextEdit()
+                editor = QPlainTextEdit()
                 editor.setFont(self.editor_font)
 
                 # Setup syntax highlighting
@@ -256,6 +526,7 @@ except ImportError:
                 # Add to tab widget
                 index = self.tab_widget.addTab(editor, "Untitled")
                 self.tab_widget.setCurrentIndex(index)
+                self._ensure_editor_chrome(editor)
 
                 # Set focus
                 editor.setFocus()
@@ -269,13 +540,13 @@ except ImportError:
                 QMessageBox.critical(self, "Error", f"Could not create new file: {str(e)}")
                 return None
 
-        def configure_editor(self, editor: QTextEdit):
+        def configure_editor(self, editor: QPlainTextEdit):
             """Configure editor settings and behavior"""
             try:
                 # Set editor properties
                 editor.setLineWrapMode(
-                    QTextEdit.LineWrapMode.WidgetWidth if self.word_wrap
-                    else QTextEdit.LineWrapMode.NoWrap
+                    QPlainTextEdit.LineWrapMode.WidgetWidth if self.word_wrap
+                    else QPlainTextEdit.LineWrapMode.NoWrap
                 )
                 editor.setTabStopDistance(
                     self.tab_size * QFontMetrics(editor.font()).horizontalAdvance(' ')
@@ -519,8 +790,12 @@ except ImportError:
                     editor.selectionChanged.connect(self.handle_selection_changed)
                     editor.modificationChanged.connect(self.handle_modification_changed)
 
-                # Tab widget connections
+                # Tab widget connections; cache invalidation must run first
+                self.tab_widget.currentChanged.connect(self.invalidate_current_editor)
                 self.tab_widget.currentChanged.connect(self.handle_tab_changed)
+                self.tab_widget.currentChanged.connect(
+                    lambda index: self._ensure_editor_chrome(self.tab_widget.widget(index))
+                )
                 self.tab_widget.tabCloseRequested.connect(self.close_tab)
 
                 # Git manager connections
@@ -1268,7 +1543,9 @@ except ImportError:
                 selection.cursor = editor.textCursor()
                 selection.cursor.clearSelection()
 
-                editor.setExtraSelections([selection])
+                editor.setExtraSelections(
+                    _with_analysis_selections(editor, [selection])
+                )
 
             except Exception as e:
                 self.logger.error(
@@ -1443,7 +1720,9 @@ except ImportError:
                     selections.append(selection)
 
                 # Apply selections
-                editor.setExtraSelections(selections)
+                editor.setExtraSelections(
+                    _with_analysis_selections(editor, selections)
+                )
 
                 self.logger.debug(f"[2025-02-16 15:24:34] Tag pair highlighted by {CURRENT_USER}")
 
@@ -1662,7 +1941,7 @@ except ImportError:
                     return
 
                 # Clear existing highlights
-                editor.setExtraSelections([])
+                editor.setExtraSelections(_with_analysis_selections(editor, []))
 
                 # Clear accessibility warnings list
                 self.accessibility_list.clear()
@@ -3060,7 +3339,7 @@ except ImportError:
                 return
 
             # Clear editor highlights
-            editor.setExtraSelections([])
+            editor.setExtraSelections(_with_analysis_selections(editor, []))
 
             # Clear warning list
             self.accessibility_list.clear()
@@ -3190,7 +3469,9 @@ except ImportError:
                     if selection:
                         selections.append(selection)
 
-            editor.setExtraSelections(selections)
+            editor.setExtraSelections(
+                _with_analysis_selections(editor, selections)
+            )
 
             self.logger.debug(
                 f"[2025-02-16 15:39:16] Git line indicators updated by {CURRENT_USER}"
@@ -3238,15 +3519,12 @@ except ImportError:
                 )
 
             # Set selection format based on change type
-            format = QTextCharFormat()
-            colors = {
-                'added': QColor("#e6ffe6"),  # Light green
-                'modified': QColor("#fff5e6"),  # Light orange
-                'deleted': QColor("#ffe6e6")  # Light red
-            }
-            format.setBackground(colors.get(change_type, QColor("#f0f0f0")))
+            char_format = QTextCharFormat()
+            char_format.setBackground(
+                _GIT_SEL_COLORS.get(change_type, _GIT_SEL_DEFAULT)
+            )
 
-            selection.format = format
+            selection.format = char_format
             selection.cursor = cursor
 
             return selection
@@ -3418,6 +3696,31 @@ except ImportError:
             return QDialog(self)
 
 
+    def format_diff_content(self, diff: str) -> str:
+        """
+        Convert unified diff text to highlighted HTML
+        
+        Args:
+            diff (str): Raw diff content
+            
+        Returns:
+            str: HTML markup for the diff viewer
+        """
+        try:
+            content = html.escape(diff, quote=False)
+            content = _DIFF_HDR.sub(r'<span class="hunk">\g<0></span>', content)
+            content = _DIFF_ADD.sub(r'<span class="added">\g<0></span>', content)
+            content = _DIFF_DEL.sub(r'<span class="deleted">\g<0></span>', content)
+
+            return f"{_DIFF_STYLE}<pre>{content}</pre>"
+
+        except Exception as e:
+            self.logger.error(
+                f"[2025-02-16 15:40:20] Error formatting diff content: {str(e)}"
+            )
+            return f"<pre>{html.escape(diff, quote=False)}</pre>"
+
+
     def restore_from_backup(self):
         """
         Restore file from backup
@@ -3460,16 +3763,48 @@ except ImportError:
                 selected_backup
             )
 
-            try:
-                with open(backup_path, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            except UnicodeDecodeError:
-                with open(backup_path, 'r', encoding='latin-1') as f:
-                    content = f.read()
-
-            # Update editor content
             editor = self.current_editor()
-            if editor:
+            if not editor:
+                return
+
+            # Read the backup in the background; the editor is updated
+            # from apply_backup_content on the GUI thread
+            self._backup_restore_target = (editor, selected_backup)
+            thread = QThread(self)
+            worker = BackupReadWorker(backup_path)
+            worker.moveToThread(thread)
+
+            thread.started.connect(worker.run)
+            worker.content_ready.connect(self.apply_backup_content)
+            worker.failed.connect(self.handle_backup_read_failed)
+            worker.finished.connect(thread.quit)
+            worker.finished.connect(worker.deleteLater)
+            thread.finished.connect(thread.deleteLater)
+
+            self._backup_read_worker = worker
+            thread.start()
+
+            self.show_status_message(f"Restoring from backup: {selected_backup}")
+
+        except Exception as e:
+            self.logger.error(
+                f"[2025-02-16 15:42:47] Error restoring from backup: {str(e)}"
+            )
+
+
+    def apply_backup_content(self, content: str):
+        """
+        Replace the editor text with content read by BackupReadWorker
+        
+        Args:
+            content (str): Decoded backup file content
+        """
+        try:
+            editor, selected_backup = self._backup_restore_target
+            self._backup_restore_target = None
+            self._backup_read_worker = None
+
+            if editor is not None:
                 editor.setPlainText(content)
                 self.show_status_message(
                     f"Restored from backup: {selected_backup}"
@@ -3481,10 +3816,61 @@ except ImportError:
 
         except Exception as e:
             self.logger.error(
-                f"[2025-02-16 15:42:47] Error restoring from backup: {str(e)}"
+                f"[2025-02-16 15:42:47] Error applying backup content: {str(e)}"
             )
 
 
+    def handle_backup_read_failed(self, error: str):
+        """
+        Drop the pending restore when BackupReadWorker could not read it
+        
+        Args:
+            error (str): Read error message
+        """
+        _, selected_backup = self._backup_restore_target or (None, '')
+        self._backup_restore_target = None
+        self._backup_read_worker = None
+        self.show_status_message(
+            f"Failed to restore from backup: {selected_backup}", error=True
+        )
+
+
+    class BackupReadWorker(QObject):
+        """Worker class for reading backup files off the GUI thread"""
+
+        # Define signals
+        content_ready = pyqtSignal(str)
+        failed = pyqtSignal(str)
+        finished = pyqtSignal()
+
+        def __init__(self, backup_path: str):
+            super().__init__()
+            self.backup_path = backup_path
+            self.logger = logging.getLogger(__name__)
+
+        def run(self):
+            """Read and decode the backup file in a single pass"""
+            try:
+                with open(self.backup_path, 'rb') as f:
+                    raw = f.read()
+
+                # Non-UTF-8 backups are restored byte for byte
+                try:
+                    content = raw.decode('utf-8')
+                except UnicodeDecodeError:
+                    content = raw.decode('latin-1')
+
+                self.content_ready.emit(content)
+
+            except Exception as e:
+                self.logger.error(
+                    f"[2025-02-16 15:42:47] Error reading backup file: {str(e)}"
+                )
+                self.failed.emit(str(e))
+            finally:
+                self.finished.emit()
+
+
     def setup_snippet_manager(self):
         """
         Setup code snippet management system
@@ -3494,6 +3880,14 @@ except ImportError:
             self.snippets: Dict[str, Dict] = {}
             self.snippet_categories: Set[str] = set()
 
+            # Resolve storage paths once
+            self._snippet_path = os.path.join(
+                os.path.expanduser('~'),
+                '.editor_snippets.json'
+            )
+            self._snippet_temp_path = f"{self._snippet_path}.tmp"
+            self._snippet_backup_path = f"{self._snippet_path}.bak"
+
             # Load snippets
             self.load_snippets()
 
@@ -3513,10 +3907,7 @@ except ImportError:
     def load_snippets(self):
         """Load code snippets from storage"""
         try:
-            snippet_file = os.path.join(
-                os.path.expanduser('~'),
-                '.editor_snippets.json'
-            )
+            snippet_file = self._snippet_path
 
             if os.path.exists(snippet_file):
                 try:
@@ -3543,10 +3934,7 @@ except ImportError:
     def save_snippets(self):
         """Save code snippets to storage"""
         try:
-            snippet_file = os.path.join(
-                os.path.expanduser('~'),
-                '.editor_snippets.json'
-            )
+            snippet_file = self._snippet_path
 
             data = {
                 'snippets': self.snippets,
@@ -3555,11 +3943,10 @@ except ImportError:
 
             # Create backup before saving
             if os.path.exists(snippet_file):
-                backup_file = f"{snippet_file}.bak"
-                shutil.copy2(snippet_file, backup_file)
+                shutil.copy2(snippet_file, self._snippet_backup_path)
 
             # Save with atomic write
-            temp_file = f"{snippet_file}.tmp"
+            temp_file = self._snippet_temp_path
             with open(temp_file, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=4, ensure_ascii=False)
 
@@ -3618,6 +4005,15 @@ except ImportError:
             self.category_combo.setStatusTip("Filter snippets by category")
             self.snippet_toolbar.addWidget(self.category_combo)
 
+            # Persistent insert menu; actions are reused across filter changes
+            self.snippet_menu: QMenu = QMenu("Insert Snippet", self)
+            self._snippet_actions: Dict[str, QAction] = {}
+            self._snippet_action_pool: List[QAction] = []
+            self._snippet_placeholder = QAction("No snippets available", self)
+            self._snippet_placeholder.setEnabled(False)
+            self.snippet_menu.addAction(self._snippet_placeholder)
+            self.snippet_toolbar.addAction(self.snippet_menu.menuAction())
+
             self.logger.debug(
                 f"[2025-02-16 15:43:49] Snippet toolbar setup by {CURRENT_USER}"
             )
@@ -3698,12 +4094,13 @@ except ImportError:
                 return False
 
             # Create snippet data
+            now_iso = datetime.now().isoformat()
             snippet = {
                 'content': content,
                 'description': description,
                 'category': category,
-                'created': datetime.now().isoformat(),
-                'modified': datetime.now().isoformat(),
+                'created': now_iso,
+                'modified': now_iso,
                 'created_by': CURRENT_USER,
                 'modified_by': CURRENT_USER,
                 'usage_count': 0
@@ -3805,11 +4202,6 @@ except ImportError:
                 self.show_error_message("Snippet names cannot be empty")
                 return False
 
-            # Check for duplicate names
-            if len(updated_snippets) != len(set(updated_snippets.keys())):
-                self.show_error_message("Duplicate snippet names found")
-                return False
-
             # Validate snippet data
             for name, snippet in updated_snippets.items():
                 if not snippet.get('content', '').strip():
@@ -3818,11 +4210,16 @@ except ImportError:
                     )
                     return False
 
-                if snippet.get('category') not in updated_categories:
-                    self.show_error_message(
-                        f"Invalid category for snippet '{name}'"
-                    )
-                    return False
+            # Uncategorized snippets are allowed, as in add_snippet
+            categories_used = {
+                snippet.get('category') for snippet in updated_snippets.values()
+            }
+            invalid = categories_used - updated_categories - {None, ''}
+            if invalid:
+                self.show_error_message(
+                    f"Invalid categories: {', '.join(sorted(invalid))}"
+                )
+                return False
 
             self.logger.debug(
                 f"[2025-02-16 15:44:34] Snippet changes validated by {CURRENT_USER}"
@@ -3912,44 +4309,43 @@ except ImportError:
             snippets (Dict[str, Dict]): Filtered snippets to display
         """
         try:
-            # Remove existing menu
-            if hasattr(self, 'snippet_menu'):
-                self.snippet_toolbar.removeAction(
-                    self.snippet_menu.menuAction()
-                )
+            actions = self._snippet_actions
 
-            # Create new menu
-            self.snippet_menu = QMenu("Insert Snippet", self)
+            # Detach actions that are no longer shown and keep them for reuse
+            for name in set(actions) - set(snippets):
+                action = actions.pop(name)
+                self.snippet_menu.removeAction(action)
+                self._snippet_action_pool.append(action)
 
-            if not snippets:
-                # Add placeholder for empty menu
-                action = QAction("No snippets available", self)
-                action.setEnabled(False)
-                self.snippet_menu.addAction(action)
-            else:
-                # Add snippets sorted by name
-                for name in sorted(snippets.keys()):
-                    snippet = snippets[name]
+            # Attach newly shown snippets, keeping the menu sorted by name
+            ordered = sorted(actions)
+            for name in sorted(set(snippets) - set(actions)):
+                if self._snippet_action_pool:
+                    action = self._snippet_action_pool.pop()
+                    action.setText(name)
+                else:
                     action = QAction(name, self)
-
-                    # Add description as tooltip
-                    if snippet.get('description'):
-                        action.setToolTip(snippet['description'])
-
-                    # Add keyboard shortcut if defined
-                    if 'shortcut' in snippet:
-                        action.setShortcut(
-                            QKeySequence(snippet['shortcut'])
-                        )
-
-                    # Connect action
                     action.triggered.connect(
-                        lambda checked, n=name: self.insert_snippet(n)
+                        lambda checked, a=action: self.insert_snippet(a.data())
                     )
+                action.setData(name)
+
+                index = bisect.bisect_right(ordered, name)
+                if index == len(ordered):
                     self.snippet_menu.addAction(action)
+                else:
+                    self.snippet_menu.insertAction(actions[ordered[index]], action)
+                ordered.insert(index, name)
+                actions[name] = action
 
-            # Add menu to toolbar
-            self.snippet_toolbar.addAction(self.snippet_menu.menuAction())
+            # Refresh tooltip and shortcut for every visible snippet
+            for name, action in actions.items():
+                snippet = snippets[name]
+                action.setToolTip(snippet.get('description', ''))
+                action.setShortcut(QKeySequence(snippet.get('shortcut', '')))
+
+            # Placeholder for empty menu
+            self._snippet_placeholder.setVisible(not actions)
 
             self.logger.debug(
                 f"[2025-02-16 15:44:34] Snippet menu updated by {CURRENT_USER}"
@@ -4064,24 +4460,11 @@ except ImportError:
             str: Adjusted snippet content
         """
         try:
-            lines = content.splitlines()
-            if not lines:
+            # First line uses cursor position indentation; subsequent
+            # non-blank lines keep their relative indentation
+            if not indent:
                 return content
-
-            # Process each line
-            adjusted_lines = []
-            for i, line in enumerate(lines):
-                if i == 0:
-                    # First line uses cursor position indentation
-                    adjusted_lines.append(line)
-                else:
-                    # Subsequent lines maintain relative indentation
-                    if line.strip():
-                        adjusted_lines.append(indent + line)
-                    else:
-                        adjusted_lines.append(line)
-
-            return '\n'.join(adjusted_lines)
+            return _INDENT_RE.sub('\n' + indent, content)
 
         except Exception as e:
             self.logger.error(
@@ -4107,11 +4490,12 @@ except ImportError:
                 snippet['usage_count'] = 0
             snippet['usage_count'] += 1
 
-            snippet['last_used'] = datetime.now().isoformat()
+            now_iso = datetime.now().isoformat()
+            snippet['last_used'] = now_iso
             snippet['last_used_by'] = CURRENT_USER
 
             # Update modification info
-            snippet['modified'] = datetime.now().isoformat()
+            snippet['modified'] = now_iso
             snippet['modified_by'] = CURRENT_USER
 
             # Save changes
@@ -4135,6 +4519,11 @@ except ImportError:
             self.current_macro: List[Dict] = []
             self.saved_macros: Dict[str, Dict] = {}
 
+            # Coalesce bursts of macro edits into a single write
+            self._save_macros_timer = QTimer(self)
+            self._save_macros_timer.setSingleShot(True)
+            self._save_macros_timer.timeout.connect(self._do_save_macros)
+
             # Load saved macros
             self.load_macros()
 
@@ -4166,13 +4555,18 @@ except ImportError:
 
             if os.path.exists(macro_file):
                 try:
-                    with open(macro_file, 'r', encoding='utf-8') as f:
-                        self.saved_macros = json.load(f)
+                    self.saved_macros = self.read_macro_file(macro_file)
+
+                    # Hash before validation: if invalid macros get dropped,
+                    # the next save rewrites the file without them
+                    self._last_macro_hash = hashlib.blake2b(
+                        self.serialize_macros(self.saved_macros)
+                    ).digest()
 
                     # Validate loaded macros
                     self.validate_loaded_macros()
 
-                except json.JSONDecodeError:
+                except json.JSONDecodeError:  # also raised by orjson
                     self.logger.error(
                         f"[2025-02-16 15:46:06] Invalid macro file format"
                     )
@@ -4189,17 +4583,67 @@ except ImportError:
             self.saved_macros = {}
 
 
+    def read_macro_file(self, macro_file: str) -> Dict:
+        """
+        Parse the macro file, mapping it into memory when orjson is available
+        
+        Args:
+            macro_file (str): Path to the macro file
+            
+        Returns:
+            Dict: Parsed macro data
+        """
+        with open(macro_file, 'rb') as f:
+            if HAS_ORJSON and os.name != 'nt' and os.fstat(f.fileno()).st_size:
+                # orjson parses straight from the mapping, skipping a copy
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+
+            raw = f.read()
+            return orjson.loads(raw) if HAS_ORJSON else json.loads(raw)
+
+
+    def serialize_macros(self, macros: Dict) -> bytes:
+        """
+        Serialize macros the way they are written to the macro file
+        
+        Args:
+            macros (Dict): Macro data
+            
+        Returns:
+            bytes: UTF-8 encoded JSON
+        """
+        if HAS_ORJSON:
+            return orjson.dumps(macros, option=orjson.OPT_INDENT_2)
+
+        return json.dumps(macros, indent=2, ensure_ascii=False).encode('utf-8')
+
+
     def validate_loaded_macros(self):
         """Validate loaded macros and remove invalid ones"""
         try:
-            valid_macros = {}
-            for name, macro in self.saved_macros.items():
-                if self.is_valid_macro(name, macro):
-                    valid_macros[name] = macro
-                else:
-                    self.logger.warning(
-                        f"[2025-02-16 15:46:06] Invalid macro removed: {name}"
-                    )
+            if not isinstance(self.saved_macros, dict):
+                self.saved_macros = {}
+                return
+
+            required = _MACRO_REQUIRED_FIELDS
+            _dict, _list = dict, list
+            valid_macros = {
+                name: macro for name, macro in self.saved_macros.items()
+                if type(macro) is _dict
+                and required <= macro.keys()
+                and type(macro['actions']) is _list
+                and all(
+                    type(action) is _dict and 'type' in action and 'data' in action
+                    for action in macro['actions']
+                )
+            }
+
+            for name in self.saved_macros.keys() - valid_macros.keys():
+                self.logger.warning(
+                    f"[2025-02-16 15:46:06] Invalid macro removed: {name}"
+                )
 
             self.saved_macros = valid_macros
 
@@ -4220,53 +4664,95 @@ except ImportError:
         Returns:
             bool: True if macro is valid, False otherwise
         """
-        try:
-            # Check required fields
-            required_fields = {'actions', 'created', 'modified'}
-            if not all(field in macro for field in required_fields):
-                return False
+        return (
+            isinstance(macro, dict)
+            and _MACRO_REQUIRED_FIELDS <= macro.keys()
+            and isinstance(macro['actions'], list)
+            and all(
+                isinstance(action, dict) and 'type' in action and 'data' in action
+                for action in macro['actions']
+            )
+        )
 
-            # Check actions list
-            if not isinstance(macro['actions'], list):
-                return False
 
-            # Validate each action
-            for action in macro['actions']:
-                if not isinstance(action, dict):
-                    return False
-                if 'type' not in action or 'data' not in action:
-                    return False
+    def save_macros(self):
+        """Schedule a macro save; rapid successive calls result in one write"""
+        self._save_macros_timer.start(500)
 
-            return True
 
-        except Exception:
-            return False
+    def flush_macros(self):
+        """Write any pending macro changes immediately"""
+        if self._save_macros_timer.isActive():
+            self._save_macros_timer.stop()
+            self._do_save_macros(durable=True)
 
 
-    def save_macros(self):
-        """Save macros to storage with backup"""
+    def closeEvent(self, event):
+        """Flush pending writes before the window closes"""
+        if hasattr(self, '_save_macros_timer'):
+            self.flush_macros()
+        if hasattr(self, 'analysis_cache'):
+            self.analysis_cache.close()
+        if getattr(self, '_bookmarks_dirty', False):
+            self._bookmarks_save_timer.stop()
+            self.save_bookmarks()
+        if hasattr(self, 'completion_thread'):
+            self.completion_thread.quit()
+            self.completion_thread.wait()
+        QMainWindow.closeEvent(self, event)
+
+
+    def _do_save_macros(self, durable: bool = False):
+        """
+        Save macros to storage with backup
+        
+        Args:
+            durable (bool): fsync the new file before replacing the old one.
+                The rename alone already keeps the file consistent on crash.
+        """
         try:
             macro_file = os.path.join(
                 os.path.expanduser('~'),
                 '.editor_macros.json'
             )
 
-            # Create backup if file exists
+            payload = self.serialize_macros(self.saved_macros)
+
+            # Skip the write entirely if nothing changed since last save
+            payload_hash = hashlib.blake2b(payload).digest()
+            if payload_hash == getattr(self, '_last_macro_hash', None):
+                return
+
+            # Back up the current file by hard link; the atomic replace
+            # below leaves the link pointing at the previous contents
             if os.path.exists(macro_file):
-                backup_file = f"{macro_file}.{int(time.time())}.bak"
-                shutil.copy2(macro_file, backup_file)
+                backup_file = f"{macro_file}.{time.time_ns()}.bak"
+                try:
+                    os.link(macro_file, backup_file)
+                except OSError:
+                    # Cross-device or unsupported filesystem
+                    shutil.copy2(macro_file, backup_file)
+
+                # Keep only the most recent backups
+                backups = sorted(glob.glob(f"{glob.escape(macro_file)}.*.bak"))
+                for old_backup in backups[:-MACRO_BACKUP_COUNT]:
+                    os.unlink(old_backup)
 
             # Save with atomic write
             temp_file = f"{macro_file}.tmp"
-            with open(temp_file, 'w', encoding='utf-8') as f:
-                json.dump(
-                    self.saved_macros,
-                    f,
-                    indent=4,
-                    ensure_ascii=False
-                )
+            fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                # os.write may write fewer bytes than asked for
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                if durable:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
 
             os.replace(temp_file, macro_file)
+            self._last_macro_hash = payload_hash
 
             self.logger.debug(
                 f"[2025-02-16 15:46:06] Macros saved by {CURRENT_USER}"
@@ -4338,15 +4824,34 @@ except ImportError:
         Modified by: vcutrone
         """
         try:
-            # Initialize completion providers with proper typing
-            self.completion_providers: Dict[str, CompletionProvider] = {
-                'python': PythonCompletionProvider(self),
-                'javascript': JavaScriptCompletionProvider(self),
-                'typescript': TypeScriptCompletionProvider(self),
-                'java': JavaCompletionProvider(self),
-                'cpp': CppCompletionProvider(self),
-                'go': GoCompletionProvider(self)
-            }
+            # Completion providers, indexed by LANG_INDEX and built on first use
+            self._completion_factories = (
+                lambda: PythonCompletionProvider(self),
+                lambda: JavaScriptCompletionProvider(self),
+                lambda: TypeScriptCompletionProvider(self),
+                lambda: JavaCompletionProvider(self),
+                lambda: CppCompletionProvider(self),
+                lambda: GoCompletionProvider(self)
+            )
+            self.completion_providers: List[Optional[CompletionProvider]] = (
+                [None] * len(LANGUAGES)
+            )
+
+            # Debounce completion requests while typing
+            self.completion_trigger_delay = 60  # milliseconds
+            self.completion_trigger_timer = QTimer(self)
+            self.completion_trigger_timer.setSingleShot(True)
+            self.completion_trigger_timer.timeout.connect(
+                self._do_completion_trigger
+            )
+
+            # Recent completion results, invalidated on tab switch
+            self._completion_cache: OrderedDict = OrderedDict()
+            self._completion_cache_size = 256
+            self._completion_cache_version = 0
+            self.tab_widget.currentChanged.connect(
+                self.invalidate_completion_cache
+            )
 
             # Connect triggers
             self.connect_completion_triggers()
@@ -4368,19 +4873,16 @@ except ImportError:
         """Connect code completion trigger events"""
         try:
             for editor in self.editors:
-                # Disconnect existing signals to prevent duplicates
-                try:
-                    editor.textChanged.disconnect(self.handle_completion_trigger)
-                    editor.cursorPositionChanged.disconnect(self.handle_completion_trigger)
-                except:
-                    pass
-
-                # Connect signals
+                # Connect once per editor; cursor-only moves do not start
+                # completions
+                if getattr(editor, '_completion_connected', False):
+                    continue
                 editor.textChanged.connect(self.handle_completion_trigger)
-                editor.cursorPositionChanged.connect(self.handle_completion_trigger)
+                editor._completion_connected = True
 
             self.logger.debug(
-                f"[2025-02-16 15:48:31] Completion triggers connected by {CURRENT_USER}"
+                "[2025-02-16 15:48:31] Completion triggers connected by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -4391,36 +4893,61 @@ except ImportError:
 
     def handle_completion_trigger(self):
         """Handle code completion trigger event"""
+        self.completion_trigger_timer.start(self.completion_trigger_delay)
+
+
+    def _do_completion_trigger(self):
+        """Run code completion once typing has paused"""
         try:
             editor = self.current_editor()
             if not editor:
                 return
 
-            # Get current language
-            language = self.get_file_language(editor)
-            if not language or language not in self.completion_providers:
-                return
-
-            # Get completion provider
-            provider = self.completion_providers[language]
-
             # Get context
             cursor = editor.textCursor()
             block_text = cursor.block().text()
             position = cursor.positionInBlock()
 
-            # Check trigger conditions
+            # Check trigger conditions before any per-document work
             if not self.should_trigger_completion(block_text, position):
                 self.hide_completion_widget()
                 return
 
-            # Get suggestions
-            suggestions = provider.get_completions(
-                text=block_text,
-                position=position,
-                full_text=editor.toPlainText(),
-                file_path=getattr(editor, 'file_path', None)
-            )
+            # Get current language
+            lang_index = self.get_language_index(editor)
+            if lang_index is None:
+                return
+
+            # Get completion provider
+            provider = self.completion_providers[lang_index]
+            if provider is None:
+                provider = self._completion_factories[lang_index]()
+                self.completion_providers[lang_index] = provider
+
+            # Get suggestions, reusing results for an identical context
+            full_text = editor.toPlainText()
+            cache_key = (
+                self._completion_cache_version,
+                lang_index,
+                cursor.blockNumber(),
+                block_text,
+                position,
+                hash(full_text)
+            )
+            cache = self._completion_cache
+            suggestions = cache.get(cache_key)
+            if suggestions is not None:
+                cache.move_to_end(cache_key)
+            else:
+                suggestions = provider.get_completions(
+                    text=block_text,
+                    position=position,
+                    full_text=full_text,
+                    file_path=getattr(editor, 'file_path', None)
+                )
+                cache[cache_key] = suggestions
+                if len(cache) > self._completion_cache_size:
+                    cache.popitem(last=False)
 
             if suggestions:
                 self.show_completion_popup(suggestions)
@@ -4428,7 +4955,8 @@ except ImportError:
                 self.hide_completion_widget()
 
             self.logger.debug(
-                f"[2025-02-16 15:48:31] Handled completion trigger for {language}"
+                "[2025-02-16 15:48:31] Handled completion trigger for %s",
+                LANGUAGES[lang_index]
             )
 
         except Exception as e:
@@ -4437,38 +4965,57 @@ except ImportError:
             )
 
 
-    def should_trigger_completion(self, text: str, position: int) -> bool:
+    def invalidate_completion_cache(self, *args):
+        """Drop cached completion results, e.g. after switching files"""
+        self._completion_cache_version += 1
+        self._completion_cache.clear()
+
+
+    def get_language_index(self, editor: QTextEdit) -> Optional[int]:
         """
-        Check if completion should be triggered
+        Get the editor's provider index, resolving it again only after a rename
         
         Args:
-            text (str): Current line text
-            position (int): Cursor position in line
+            editor (QTextEdit): The editor instance
             
         Returns:
-            bool: True if completion should be triggered
+            Optional[int]: Index into LANGUAGES, or None if unsupported
         """
-        try:
-            if position == 0:
-                return False
+        file_path = getattr(editor, 'file_path', None)
+        cached = getattr(editor, '_cached_language', None)
+        if cached is not None and cached[0] == file_path:
+            return cached[1]
 
-            # Get character before cursor
-            prev_char = text[position - 1] if position > 0 else ''
+        lang_index = LANG_INDEX.get(self.get_file_language(editor))
+        editor._cached_language = (file_path, lang_index)
+        return lang_index
 
-            # Trigger conditions
-            trigger_chars = {'.', ':', '(', '<', '"', "'"}
 
-            # Check for identifier characters
-            is_identifier = (
-                    prev_char.isalnum() or
-                    prev_char == '_'
-            )
+    def should_trigger_completion(self, text: str, position: int) -> bool:
+        """
+        Check if completion should be triggered
+        
+        Args:
+            text (str): Current line text
+            position (int): Cursor position in line
+            
+        Returns:
+            bool: True if completion should be triggered
+        """
+        try:
+            if position <= 0 or position > len(text):
+                return False
 
-            # Check trigger conditions
-            return (
-                    prev_char in trigger_chars or
-                    (is_identifier and position >= 3)
-            )
+            # Classify the character before the cursor
+            prev_char = text[position - 1]
+            code = ord(prev_char)
+            if code < 128:
+                flag = _TRIGGER_TABLE[code]
+            else:
+                flag = 2 if prev_char.isalnum() else 0
+
+            # Trigger characters always fire; identifiers need 3 columns
+            return flag == 1 or (flag == 2 and position >= 3)
 
         except Exception as e:
             self.logger.error(
@@ -4524,7 +5071,8 @@ except ImportError:
             self.completion_widget.show()
 
             self.logger.debug(
-                f"[2025-02-16 15:49:13] Showed completion popup by {CURRENT_USER}"
+                "[2025-02-16 15:49:13] Showed completion popup by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -4540,7 +5088,8 @@ except ImportError:
                 self.completion_widget.hide()
 
             self.logger.debug(
-                f"[2025-02-16 15:49:13] Hidden completion widget by {CURRENT_USER}"
+                "[2025-02-16 15:49:13] Hidden completion widget by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -4567,10 +5116,12 @@ except ImportError:
             cursor.beginEditBlock()
 
             try:
-                # Remove trigger text if needed
+                # Select trigger text so the insert replaces it
                 if 'remove_chars' in suggestion:
-                    for _ in range(suggestion['remove_chars']):
-                        cursor.deletePreviousChar()
+                    cursor.setPosition(
+                        max(0, cursor.position() - suggestion['remove_chars']),
+                        QTextCursor.MoveMode.KeepAnchor
+                    )
 
                 # Insert completion text
                 cursor.insertText(suggestion['text'])
@@ -4589,7 +5140,8 @@ except ImportError:
             self.hide_completion_widget()
 
             self.logger.debug(
-                f"[2025-02-16 15:49:13] Applied completion by {CURRENT_USER}"
+                "[2025-02-16 15:49:13] Applied completion by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -4631,7 +5183,8 @@ except ImportError:
                 )
 
             self.logger.debug(
-                f"[2025-02-16 15:49:13] Handled snippet placeholders by {CURRENT_USER}"
+                "[2025-02-16 15:49:13] Handled snippet placeholders by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -4648,15 +5201,37 @@ except ImportError:
         Modified by: vcutrone
         """
         try:
-            # Initialize analysis providers with typing
-            self.analysis_providers: Dict[str, AnalysisProvider] = {
-                'python': PythonAnalysisProvider(self),
-                'javascript': JavaScriptAnalysisProvider(self),
-                'typescript': TypeScriptAnalysisProvider(self),
-                'java': JavaAnalysisProvider(self),
-                'cpp': CppAnalysisProvider(self),
-                'go': GoAnalysisProvider(self)
-            }
+            # Analysis providers, indexed by LANG_INDEX and built on first use
+            self._analysis_factories = (
+                lambda: PythonAnalysisProvider(self),
+                lambda: JavaScriptAnalysisProvider(self),
+                lambda: TypeScriptAnalysisProvider(self),
+                lambda: JavaAnalysisProvider(self),
+                lambda: CppAnalysisProvider(self),
+                lambda: GoAnalysisProvider(self)
+            )
+            self.analysis_providers: List[Optional[AnalysisProvider]] = (
+                [None] * len(LANGUAGES)
+            )
+
+            # Persistent results cache keyed by (path, sha256(provider
+            # tag + content)); only the latest entry per path is kept
+            self.analysis_cache = sqlite3.connect(
+                os.path.join(os.path.expanduser('~'), '.editor_analysis.db')
+            )
+            self.analysis_cache.execute(
+                "CREATE TABLE IF NOT EXISTS analysis ("
+                "path TEXT, hash BLOB, results TEXT, "
+                "PRIMARY KEY (path, hash))"
+            )
+
+            # Shared signal source for pooled analysis workers
+            self._analysis_signals = AnalysisSignals(self)
+            self._analysis_signals.results_ready.connect(
+                self.handle_worker_results
+            )
+            self._active_analysis_token = 0
+            self._analysis_cache_keys: Dict[int, Tuple[str, bytes]] = {}
 
             # Setup analysis timer with debouncing
             self.analysis_delay = 1000  # 1 second delay
@@ -4681,17 +5256,15 @@ except ImportError:
         """Connect code analysis trigger events"""
         try:
             for editor in self.editors:
-                # Disconnect existing signals
-                try:
-                    editor.textChanged.disconnect(self.trigger_analysis)
-                except:
-                    pass
-
-                # Connect signal
+                # Connect once per editor
+                if getattr(editor, '_analysis_connected', False):
+                    continue
                 editor.textChanged.connect(self.trigger_analysis)
+                editor._analysis_connected = True
 
             self.logger.debug(
-                f"[2025-02-16 15:49:53] Analysis triggers connected by {CURRENT_USER}"
+                "[2025-02-16 15:49:53] Analysis triggers connected by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -4702,19 +5275,8 @@ except ImportError:
 
     def trigger_analysis(self):
         """Trigger code analysis with debouncing"""
-        try:
-            # Reset timer
-            self.analysis_timer.stop()
-            self.analysis_timer.start(self.analysis_delay)
-
-            self.logger.debug(
-                f"[2025-02-16 15:49:53] Analysis triggered by {CURRENT_USER}"
-            )
-
-        except Exception as e:
-            self.logger.error(
-                f"[2025-02-16 15:49:53] Error triggering analysis: {str(e)}"
-            )
+        # start() restarts a running single-shot timer
+        self.analysis_timer.start(self.analysis_delay)
 
 
     def run_code_analysis(self):
@@ -4725,26 +5287,42 @@ except ImportError:
                 return
 
             # Get current language
-            language = self.get_file_language(editor)
-            if not language or language not in self.analysis_providers:
+            lang_index = self.get_language_index(editor)
+            if lang_index is None:
                 return
 
             # Get analysis provider
-            provider = self.analysis_providers[language]
+            provider = self.analysis_providers[lang_index]
+            if provider is None:
+                provider = self._analysis_factories[lang_index]()
+                self.analysis_providers[lang_index] = provider
 
             # Get file content and path
             content = editor.toPlainText()
             file_path = getattr(editor, 'file_path', None)
 
+            # Reuse stored results for content analyzed before by the
+            # same provider and configuration
+            digest = hashlib.sha256(self.analysis_cache_tag(provider))
+            digest.update(content.encode('utf-8'))
+            cache_key = (file_path or '', digest.digest())
+            cached = self.load_cached_analysis(cache_key)
+            if cached is not None:
+                self._active_analysis_token += 1
+                self.handle_analysis_results(cached)
+                return
+
             # Run analysis asynchronously
             self.run_analysis_async(
                 provider,
                 content,
-                file_path
+                file_path,
+                cache_key
             )
 
             self.logger.debug(
-                f"[2025-02-16 15:49:53] Running code analysis for {language}"
+                "[2025-02-16 15:49:53] Running code analysis for %s",
+                LANGUAGES[lang_index]
             )
 
         except Exception as e:
@@ -4757,7 +5335,8 @@ except ImportError:
             self,
             provider: 'AnalysisProvider',
             content: str,
-            file_path: Optional[str]
+            file_path: Optional[str],
+            cache_key: Optional[Tuple[str, bytes]] = None
     ):
         """
         Run code analysis asynchronously
@@ -4766,31 +5345,29 @@ except ImportError:
             provider (AnalysisProvider): Analysis provider instance
             content (str): File content to analyze
             file_path (Optional[str]): Path to the file being analyzed
+            cache_key (Optional[Tuple[str, bytes]]): Key to store results under
         """
         try:
-            # Create analysis thread
-            thread = QThread()
+            # Newer submissions supersede any analysis still in flight
+            self._active_analysis_token += 1
+            token = self._active_analysis_token
+            if cache_key is not None:
+                self._analysis_cache_keys[token] = cache_key
+
             worker = AnalysisWorker(
                 provider,
                 content,
-                file_path
+                file_path,
+                self._analysis_signals,
+                token
             )
 
-            # Move worker to thread
-            worker.moveToThread(thread)
-
-            # Connect signals
-            thread.started.connect(worker.run)
-            worker.finished.connect(thread.quit)
-            worker.finished.connect(worker.deleteLater)
-            thread.finished.connect(thread.deleteLater)
-            worker.results_ready.connect(self.handle_analysis_results)
-
             # Start analysis
-            thread.start()
+            QThreadPool.globalInstance().start(worker)
 
             self.logger.debug(
-                f"[2025-02-16 15:49:53] Started async analysis by {CURRENT_USER}"
+                "[2025-02-16 15:49:53] Started async analysis by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -4799,6 +5376,107 @@ except ImportError:
             )
 
 
+    def handle_worker_results(self, token: int, results: List[Dict]):
+        """
+        Receive results from a pooled analysis worker
+        
+        Args:
+            token (int): Submission token of the finished worker
+            results (List[Dict]): Analysis results from provider
+        """
+        cache_key = self._analysis_cache_keys.pop(token, None)
+        if cache_key is not None:
+            self.store_cached_analysis(cache_key, results)
+
+        # Drop results superseded by a newer submission
+        if token != self._active_analysis_token:
+            return
+
+        self.handle_analysis_results(results)
+
+
+    def analysis_cache_tag(self, provider) -> bytes:
+        """
+        Identify a provider and its configuration for the analysis cache
+        
+        Args:
+            provider: Analysis provider that will produce the results
+            
+        Returns:
+            bytes: Tag hashed ahead of the content, so results from another
+                provider, version or configuration never match
+        """
+        tag = json.dumps(
+            [
+                type(provider).__qualname__,
+                getattr(provider, 'version', None),
+                getattr(provider, 'config', None)
+            ],
+            sort_keys=True,
+            default=str
+        )
+        return tag.encode('utf-8') + b'\0'
+
+
+    def load_cached_analysis(
+            self,
+            cache_key: Tuple[str, bytes]
+    ) -> Optional[List[Dict]]:
+        """
+        Look up stored analysis results
+        
+        Args:
+            cache_key (Tuple[str, bytes]): File path and content digest
+            
+        Returns:
+            Optional[List[Dict]]: Stored results or None on a miss
+        """
+        try:
+            row = self.analysis_cache.execute(
+                "SELECT results FROM analysis WHERE path = ? AND hash = ?",
+                cache_key
+            ).fetchone()
+            return json.loads(row[0]) if row else None
+
+        except Exception as e:
+            self.logger.error(
+                f"[2025-02-16 15:49:53] Error reading analysis cache: {str(e)}"
+            )
+            return None
+
+
+    def store_cached_analysis(
+            self,
+            cache_key: Tuple[str, bytes],
+            results: List[Dict]
+    ):
+        """
+        Store analysis results for later reuse
+        
+        Args:
+            cache_key (Tuple[str, bytes]): File path and content digest
+            results (List[Dict]): Analysis results from provider
+        """
+        try:
+            # Replace the path's previous entry in the same transaction so
+            # the database holds one row per file
+            with self.analysis_cache:
+                self.analysis_cache.execute(
+                    "DELETE FROM analysis WHERE path = ? AND hash != ?",
+                    cache_key
+                )
+                self.analysis_cache.execute(
+                    "INSERT OR REPLACE INTO analysis (path, hash, results) "
+                    "VALUES (?, ?, ?)",
+                    (*cache_key, json.dumps(results))
+                )
+
+        except Exception as e:
+            self.logger.error(
+                f"[2025-02-16 15:49:53] Error writing analysis cache: {str(e)}"
+            )
+
+
     def handle_analysis_results(self, results: List[Dict]):
         """
         Handle code analysis results
@@ -4814,18 +5492,17 @@ except ImportError:
             self.update_analysis_markers(results)
 
             # Update status
-            error_count = sum(1 for r in results if r['severity'] == 'error')
-            warning_count = sum(1 for r in results if r['severity'] == 'warning')
-            info_count = sum(1 for r in results if r['severity'] == 'info')
+            counts = Counter(r['severity'] for r in results)
 
             self.update_analysis_status(
-                error_count,
-                warning_count,
-                info_count
+                counts['error'],
+                counts['warning'],
+                counts['info']
             )
 
             self.logger.debug(
-                f"[2025-02-16 15:50:35] Handled analysis results by {CURRENT_USER}"
+                "[2025-02-16 15:50:35] Handled analysis results by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -4846,56 +5523,73 @@ except ImportError:
             if not editor:
                 return
 
-            # Start performance benchmark
-            start_time = time.time()
-
-            # Clear existing markers
-            editor.clear_analysis_markers()
+            # Time the update only when it will be logged
+            debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
+            if debug_enabled:
+                start_time = time.perf_counter()
+
+            # Diff against the markers currently shown in this editor
+            shown: Dict[Tuple, AnalysisMarker] = getattr(
+                editor, '_analysis_markers', None
+            ) or {}
+            keyed_results = {
+                (
+                    result.get('line', 0),
+                    result.get('column', 0),
+                    result.get('length', 0),
+                    result.get('severity', 'info'),
+                    result.get('code', ''),
+                    result.get('message', '')
+                ): result
+                for result in results
+            }
+            to_remove = shown.keys() - keyed_results.keys()
+            to_add = keyed_results.keys() - shown.keys()
+
+            remove_marker = getattr(editor, 'remove_analysis_marker', None)
+            if to_remove and remove_marker is None:
+                # No per-marker removal: clear and re-add everything current
+                editor.clear_analysis_markers()
+                AnalysisMarker.release(list(shown.values()))
+                shown = {}
+                to_add = keyed_results.keys()
+            else:
+                # Remove stale markers; a key is only forgotten once the
+                # editor has dropped its marker, and only then pooled
+                removed = []
+                try:
+                    for key in to_remove:
+                        remove_marker(shown[key])
+                        removed.append(shown.pop(key))
+                finally:
+                    AnalysisMarker.release(removed)
 
-            # Sort results by severity
-            sorted_results = sorted(
-                results,
-                key=lambda x: {
-                    'error': 0,
-                    'warning': 1,
-                    'info': 2
-                }.get(x['severity'], 3)
-            )
+            # Add new markers ordered by severity, then position
+            markers = []
+            for key in sorted(to_add, key=lambda k: (_SEV_GET(k[3], 3), k[0], k[1])):
+                line, column, length, severity, code, message = key
+                marker = AnalysisMarker(
+                    line, column, length, severity, message, code
+                )
+                shown[key] = marker
+                markers.append(marker)
 
-            # Add new markers
-            for result in sorted_results:
-                try:
-                    # Extract marker information
-                    line = result.get('line', 0)
-                    column = result.get('column', 0)
-                    length = result.get('length', 0)
-                    severity = result.get('severity', 'info')
-                    message = result.get('message', '')
-                    code = result.get('code', '')
-
-                    # Create marker
-                    marker = AnalysisMarker(
-                        line=line,
-                        column=column,
-                        length=length,
-                        severity=severity,
-                        message=message,
-                        code=code
-                    )
+            editor._analysis_markers = shown
+            editor._highlights_dirty = True
 
-                    # Add to editor
+            add_markers = getattr(editor, 'add_analysis_markers', None)
+            if add_markers is not None:
+                add_markers(markers)
+            else:
+                for marker in markers:
                     editor.add_analysis_marker(marker)
 
-                except Exception as e:
-                    self.logger.error(
-                        f"[2025-02-16 15:50:35] Error adding marker: {str(e)}"
-                    )
-
             # Log performance
-            elapsed = time.time() - start_time
-            self.logger.debug(
-                f"[2025-02-16 15:50:35] Updated {len(results)} markers in {elapsed:.3f}s"
-            )
+            if debug_enabled:
+                self.logger.debug(
+                    "[2025-02-16 15:50:35] Updated %s markers in %.3fs",
+                    len(results), time.perf_counter() - start_time
+                )
 
         except Exception as e:
             self.logger.error(
@@ -4948,12 +5642,14 @@ except ImportError:
             else:
                 color = "#00aa00"  # Green
 
-            self.analysis_status_label.setStyleSheet(
-                f"color: {color}; font-weight: bold;"
-            )
+            # Only touch the stylesheet when the color actually changes
+            if getattr(self, '_last_status_color', None) != color:
+                self.analysis_status_label.setStyleSheet(_STATUS_STYLES[color])
+                self._last_status_color = color
 
             self.logger.debug(
-                f"[2025-02-16 15:50:35] Updated analysis status by {CURRENT_USER}"
+                "[2025-02-16 15:50:35] Updated analysis status by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -4965,6 +5661,26 @@ except ImportError:
     class AnalysisMarker:
         """Class representing a code analysis marker"""
 
+        __slots__ = ('line', 'column', 'length', 'severity', 'message', 'code')
+
+        # Free list of released markers, reused by __new__
+        _marker_pool: List['AnalysisMarker'] = []
+        _MAX_POOL_SIZE = 4096
+
+        def __new__(cls, *args, **kwargs):
+            pool = cls._marker_pool
+            return pool.pop() if pool else super().__new__(cls)
+
+        @classmethod
+        def release(cls, markers):
+            """Return markers to the free list once the editor dropped them"""
+            pool = cls._marker_pool
+            for marker in markers:
+                if len(pool) >= cls._MAX_POOL_SIZE:
+                    break
+                marker.message = marker.code = ""
+                pool.append(marker)
+
         def __init__(
                 self,
                 line: int,
@@ -4981,21 +5697,25 @@ except ImportError:
             self.message = message
             self.code = code
 
-            # Set marker properties
-            self.color = {
-                'error': QColor("#ff0000"),
-                'warning': QColor("#ffa500"),
-                'info': QColor("#0000ff")
-            }.get(severity, QColor("#000000"))
+        @property
+        def color(self) -> QColor:
+            """Marker color shared by all markers of the same severity"""
+            return SEVERITY_COLORS.get(self.severity, _DEFAULT_SEVERITY_COLOR)
+
+        @property
+        def style(self) -> Qt.PenStyle:
+            """Marker pen style shared by all markers of the same severity"""
+            return SEVERITY_STYLES.get(self.severity, Qt.PenStyle.SolidLine)
+
 
-            self.style = {
-                'error': Qt.PenStyle.SolidLine,
-                'warning': Qt.PenStyle.DashLine,
-                'info': Qt.PenStyle.DotLine
-            }.get(severity, Qt.PenStyle.SolidLine)
+    class AnalysisSignals(QObject):
+        """Signals emitted by pooled AnalysisWorker runnables"""
+
+        # Define signals
+        results_ready = pyqtSignal(int, list)
 
 
-    class AnalysisWorker(QObject):
+    class AnalysisWorker(QRunnable):
         """
         Worker class for asynchronous code analysis
         
@@ -5003,24 +5723,24 @@ except ImportError:
         Modified by: vcutrone
         """
 
-        # Define signals
-        results_ready = pyqtSignal(list)
-        finished = pyqtSignal()
-
         def __init__(
                 self,
                 provider: 'AnalysisProvider',
                 content: str,
-                file_path: Optional[str]
+                file_path: Optional[str],
+                signals: 'AnalysisSignals',
+                token: int
         ):
             super().__init__()
             self.provider = provider
             self.content = content
             self.file_path = file_path
+            self.signals = signals
+            self.token = token
             self.logger = logging.getLogger(__name__)
 
         def run(self):
-            """Run analysis in background thread"""
+            """Run analysis on a thread pool thread"""
             try:
                 # Run analysis
                 results = self.provider.analyze_code(
@@ -5028,19 +5748,18 @@ except ImportError:
                     self.file_path
                 )
 
-                # Emit results
-                self.results_ready.emit(results)
+                # Emit results tagged with the submission token
+                self.signals.results_ready.emit(self.token, results)
 
                 self.logger.debug(
-                    f"[2025-02-16 15:51:21] Analysis worker completed by {CURRENT_USER}"
+                    "[2025-02-16 15:51:21] Analysis worker completed by %s",
+                    CURRENT_USER
                 )
 
             except Exception as e:
                 self.logger.error(
                     f"[2025-02-16 15:51:21] Analysis worker error: {str(e)}"
                 )
-            finally:
-                self.finished.emit()
 
 
     def setup_version_control(self):
@@ -5057,8 +5776,18 @@ except ImportError:
             self.setup_vcs_toolbar()
             self.setup_vcs_status_bar()
 
-            # Setup status polling with configurable interval
-            self.vcs_poll_interval = 5000  # 5 seconds
+            # Refresh status when repository files change, debounced
+            self.vcs_update_timer = QTimer(self)
+            self.vcs_update_timer.setSingleShot(True)
+            self.vcs_update_timer.timeout.connect(self.update_vcs_status)
+
+            self.vcs_watcher = QFileSystemWatcher(self)
+            self.vcs_watcher.fileChanged.connect(self._queue_vcs_update)
+            self.vcs_watcher.directoryChanged.connect(self._queue_vcs_update)
+            self.watch_vcs_paths()
+
+            # Slow polling only as a fallback for missed watcher events
+            self.vcs_poll_interval = 60000  # 60 seconds
             self.vcs_timer = QTimer(self)
             self.vcs_timer.timeout.connect(self.update_vcs_status)
             self.vcs_timer.start(self.vcs_poll_interval)
@@ -5073,17 +5802,67 @@ except ImportError:
             )
 
 
+    def watch_vcs_paths(self):
+        """Watch the repository index, HEAD and working tree root"""
+        try:
+            root = getattr(self, '_project_root', None)
+            if not root or not self.vcs_provider:
+                return
+
+            git_dir = os.path.join(root, '.git')
+            paths = [
+                path for path in (
+                    os.path.join(git_dir, 'index'),
+                    os.path.join(git_dir, 'HEAD'),
+                    git_dir,
+                    root
+                )
+                if os.path.exists(path)
+            ]
+            if paths:
+                self.vcs_watcher.addPaths(paths)
+
+        except Exception as e:
+            self.logger.error(
+                f"[2025-02-16 15:51:21] Error watching VCS paths: {str(e)}"
+            )
+
+
+    def _queue_vcs_update(self, path: str) -> None:
+        """
+        Queue a VCS status refresh after a watched path changed
+        
+        Args:
+            path: Watched path that changed
+        """
+        # Git replaces index/HEAD by rename, which drops the file watch
+        if path not in self.vcs_watcher.files() and os.path.isfile(path):
+            self.vcs_watcher.addPath(path)
+
+        self.vcs_update_timer.start(500)  # 500ms debounce
+
+
     def detect_vcs_provider(self):
         """Detect and initialize VCS provider"""
         try:
-            # Get project root
-            root = self.get_project_root()
+            # Get project root, resolved once per window
+            root = getattr(self, '_project_root', None)
+            if root is None:
+                root = self._project_root = self.get_project_root()
             if not root:
                 return
 
-            # Check for Git repository
-            git_dir = os.path.join(root, '.git')
-            if os.path.exists(git_dir):
+            # Detection already ran for this root
+            if getattr(self, '_vcs_detected_for_root', None) == root:
+                return
+            self._vcs_detected_for_root = root
+
+            # Check for Git repository with a single stat call
+            try:
+                os.stat(os.path.join(root, '.git'))
+            except FileNotFoundError:
+                pass
+            else:
                 from .vcs.git import GitProvider
                 self.vcs_provider = GitProvider(root)
 
@@ -5102,6 +5881,36 @@ except ImportError:
             )
 
 
+    def _make_action(
+            self,
+            icon: Optional[str],
+            name: str,
+            shortcut: Optional[str],
+            tip: Optional[str],
+            slot: Callable
+    ) -> QAction:
+        """
+        Build a QAction from one row of an action table
+        
+        Args:
+            icon (Optional[str]): Icon resource path
+            name (str): Action text
+            shortcut (Optional[str]): Key sequence
+            tip (Optional[str]): Status bar tip
+            slot (Callable): Handler for the triggered signal
+            
+        Returns:
+            QAction: Configured action parented to the window
+        """
+        action = QAction(_icon(icon), name, self) if icon else QAction(name, self)
+        if shortcut:
+            action.setShortcut(shortcut)
+        if tip:
+            action.setStatusTip(tip)
+        action.triggered.connect(slot)
+        return action
+
+
     def setup_vcs_toolbar(self):
         """Setup version control toolbar with icons and shortcuts"""
         try:
@@ -5109,62 +5918,25 @@ except ImportError:
             self.vcs_toolbar = QToolBar("Version Control")
             self.addToolBar(Qt.ToolBarArea.LeftToolBarArea, self.vcs_toolbar)
 
-            # Add commit action
-            commit_action = QAction(
-                QIcon(":/icons/commit.png"),
-                "Commit Changes",
-                self
-            )
-            commit_action.setShortcut("Ctrl+Alt+C")
-            commit_action.setStatusTip("Commit staged changes")
-            commit_action.triggered.connect(self.show_commit_dialog)
-            self.vcs_toolbar.addAction(commit_action)
-
-            # Add push action
-            push_action = QAction(
-                QIcon(":/icons/push.png"),
-                "Push Changes",
-                self
-            )
-            push_action.setShortcut("Ctrl+Alt+P")
-            push_action.setStatusTip("Push commits to remote")
-            push_action.triggered.connect(self.push_changes)
-            self.vcs_toolbar.addAction(push_action)
-
-            # Add pull action
-            pull_action = QAction(
-                QIcon(":/icons/pull.png"),
-                "Pull Changes",
-                self
-            )
-            pull_action.setShortcut("Ctrl+Alt+L")
-            pull_action.setStatusTip("Pull changes from remote")
-            pull_action.triggered.connect(self.pull_changes)
-            self.vcs_toolbar.addAction(pull_action)
-
-            self.vcs_toolbar.addSeparator()
-
-            # Add branch action
-            branch_action = QAction(
-                QIcon(":/icons/branch.png"),
-                "Manage Branches",
-                self
-            )
-            branch_action.setShortcut("Ctrl+Alt+B")
-            branch_action.setStatusTip("Manage branches")
-            branch_action.triggered.connect(self.show_branch_dialog)
-            self.vcs_toolbar.addAction(branch_action)
+            actions = [
+                (":/icons/commit.png", "Commit Changes", "Ctrl+Alt+C",
+                 "Commit staged changes", self.show_commit_dialog),
+                (":/icons/push.png", "Push Changes", "Ctrl+Alt+P",
+                 "Push commits to remote", self.push_changes),
+                (":/icons/pull.png", "Pull Changes", "Ctrl+Alt+L",
+                 "Pull changes from remote", self.pull_changes),
+                None,  # Separator
+                (":/icons/branch.png", "Manage Branches", "Ctrl+Alt+B",
+                 "Manage branches", self.show_branch_dialog),
+                (":/icons/stage.png", "Stage Changes", "Ctrl+Alt+S",
+                 "Stage current file changes", self.stage_current_file)
+            ]
 
-            # Add stage action
-            stage_action = QAction(
-                QIcon(":/icons/stage.png"),
-                "Stage Changes",
-                self
-            )
-            stage_action.setShortcut("Ctrl+Alt+S")
-            stage_action.setStatusTip("Stage current file changes")
-            stage_action.triggered.connect(self.stage_current_file)
-            self.vcs_toolbar.addAction(stage_action)
+            for entry in actions:
+                if entry is None:
+                    self.vcs_toolbar.addSeparator()
+                else:
+                    self.vcs_toolbar.addAction(self._make_action(*entry))
 
             # Enable/disable based on VCS availability
             self.update_vcs_actions()
@@ -5187,13 +5959,9 @@ except ImportError:
         Modified by: vcutrone
         """
         try:
-            # Configure line number area with proper typing
-            for editor in self.editors:
-                if not hasattr(editor, 'line_number_area'):
-                    editor.line_number_area = LineNumberArea(editor)
-                    editor.blockCountChanged.connect(editor.update_line_number_width)
-                    editor.updateRequest.connect(editor.update_line_number_area)
-                    editor.update_line_number_width()
+            # Line number areas are attached per editor when first shown,
+            # including the first tab, whose addTab emits currentChanged;
+            # see _ensure_editor_chrome
 
             self.logger.debug(
                 f"[2025-02-16 15:53:24] Line numbers setup by {CURRENT_USER}"
@@ -5205,25 +5973,53 @@ except ImportError:
             )
 
 
-    def update_line_numbers(self):
-        """Update line numbers for current editor"""
-        try:
-            editor = self.current_editor()
-            if not editor:
-                return
-
-            if hasattr(editor, 'line_number_area'):
-                editor.update_line_number_width()
-                editor.line_number_area.update()
+    def update_margin_lines(self, editor: QPlainTextEdit, margin: QWidget,
+                            first_line: int, last_line: Optional[int] = None):
+        """
+        Repaint only the margin rows covering a range of lines
+        
+        Args:
+            editor (QPlainTextEdit): Editor the margin belongs to
+            margin (QWidget): Line number, folding or bookmark margin
+            first_line (int): First line to repaint
+            last_line (int, optional): Last line to repaint; None repaints
+                down to the bottom of the margin
+        """
+        document = editor.document()
+        offset = editor.contentOffset()
+        block = document.findBlockByNumber(first_line)
+        if not block.isValid():
+            margin.update()
+            return
+
+        top = int(editor.blockBoundingGeometry(block).translated(offset).top())
+        if last_line is None:
+            bottom = margin.height()
+        else:
+            end_block = document.findBlockByNumber(last_line)
+            if not end_block.isValid():
+                end_block = document.lastBlock()
+            bottom = int(editor.blockBoundingGeometry(end_block).translated(offset).bottom())
+
+        if bottom >= 0 and top <= margin.height():
+            margin.update(QRect(0, top, margin.width(), bottom - top + 1))
 
-            self.logger.debug(
-                f"[2025-02-16 15:53:24] Line numbers updated by {CURRENT_USER}"
-            )
 
-        except Exception as e:
-            self.logger.error(
-                f"[2025-02-16 15:53:24] Error updating line numbers: {str(e)}"
-            )
+    def update_line_numbers(self):
+        """Update line numbers for current editor"""
+        editor = self.current_editor()
+        if not editor:
+            return
+
+        if hasattr(editor, 'line_number_area'):
+            editor.update_line_number_width()
+            line = editor.textCursor().blockNumber()
+            self.update_margin_lines(editor, editor.line_number_area, line, line)
+
+        self.logger.debug(
+            "Line numbers updated by %s",
+            CURRENT_USER
+        )
 
 
     class LineNumberArea(QWidget):
@@ -5253,13 +6049,16 @@ except ImportError:
             )
 
             # Add to dock widget with proper positioning
-            minimap_dock = QDockWidget("Minimap", self)
-            minimap_dock.setWidget(self.minimap)
-            minimap_dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
-            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, minimap_dock)
+            self.minimap_dock = QDockWidget("Minimap", self)
+            self.minimap_dock.setWidget(self.minimap)
+            self.minimap_dock.setAllowedAreas(Qt.DockWidgetArea.RightDockWidgetArea)
+            self.addDockWidget(Qt.DockWidgetArea.RightDockWidgetArea, self.minimap_dock)
 
             # Connect signals
             self.tab_widget.currentChanged.connect(self.update_minimap)
+            self.minimap_dock.visibilityChanged.connect(
+                self.handle_minimap_visibility
+            )
 
             # Initial update
             self.update_minimap()
@@ -5281,30 +6080,86 @@ except ImportError:
         Args:
             index (int, optional): Tab index that changed
         """
-        try:
-            editor = self.current_editor()
-            if not editor or not hasattr(self, 'minimap'):
-                return
+        editor = self.current_editor()
+        if not editor or not hasattr(self, 'minimap'):
+            return
 
-            # Update content with debouncing
+        # Hidden minimap: nothing to render, drop any pending update
+        if not self.minimap_dock.isVisible():
             if hasattr(self, 'minimap_timer'):
                 self.minimap_timer.stop()
-            else:
-                self.minimap_timer = QTimer(self)
-                self.minimap_timer.setSingleShot(True)
-                self.minimap_timer.timeout.connect(
-                    lambda: self.minimap.update_content(editor)
-                )
-
+            return
+
+        if not hasattr(self, 'minimap_timer'):
+            self.minimap_timer = QTimer(self)
+            self.minimap_timer.setSingleShot(True)
+            self.minimap_timer.timeout.connect(self.refresh_minimap)
+            self._minimap_last_run = 0.0
+
+        # Throttle: render at once when idle, otherwise coalesce
+        # bursts into a single trailing update
+        if time.monotonic() - self._minimap_last_run > MINIMAP_THROTTLE_INTERVAL:
+            self.minimap_timer.stop()
+            self.refresh_minimap()
+        else:
             self.minimap_timer.start(100)  # 100ms delay
 
-            self.logger.debug(
-                f"[2025-02-16 15:53:24] Minimap updated by {CURRENT_USER}"
-            )
+        self.logger.debug(
+            "Minimap updated by %s",
+            CURRENT_USER
+        )
+
+
+    def refresh_minimap(self):
+        """Render the current editor into the minimap"""
+        self._minimap_last_run = time.monotonic()
+        editor = self.current_editor()
+        if editor:
+            self.minimap.update_content(editor)
+
+
+    def handle_minimap_visibility(self, visible: bool):
+        """Bring the minimap up to date as soon as it is shown again"""
+        if visible:
+            self.refresh_minimap()
+
+
+    def _ensure_editor_chrome(self, editor: Optional[QPlainTextEdit]):
+        """
+        Attach line numbers, folding and bookmark margins to an editor
+        the first time it is shown
+        
+        Args:
+            editor (QPlainTextEdit): Editor about to be displayed
+        """
+        # Non-editor tabs (previews, welcome pages) get no margins
+        if not isinstance(editor, QPlainTextEdit) or getattr(editor, '_chrome_ready', False):
+            return
+
+        try:
+            if not hasattr(editor, 'line_number_area'):
+                editor.line_number_area = LineNumberArea(editor)
+                editor.blockCountChanged.connect(editor.update_line_number_width)
+                editor.updateRequest.connect(editor.update_line_number_area)
+                editor.update_line_number_width()
+
+            if not hasattr(editor, 'folding_manager'):
+                editor.folding_manager = CodeFoldingManager(editor)
+                editor.blockCountChanged.connect(editor.folding_manager.update_folding_regions)
+                editor.textChanged.connect(editor.folding_manager.schedule_update)
+                editor.setup_folding_margin()
+
+            if not hasattr(editor, 'bookmark_margin'):
+                editor.bookmark_margin = BookmarkMargin(editor)
+
+            if hasattr(self, 'minimap_update_timer'):
+                self.connect_minimap_signals(editor)
+
+            editor._chrome_ready = True
 
         except Exception as e:
             self.logger.error(
-                f"[2025-02-16 15:53:24] Error updating minimap: {str(e)}"
+                f"[2025-02-16 15:54:01] Error attaching editor margins: {str(e)}"
             )
 
 
@@ -5316,17 +6171,8 @@ except ImportError:
         Modified by: vcutrone
         """
         try:
-            # Configure folding for each editor
-            for editor in self.editors:
-                if not hasattr(editor, 'folding_manager'):
-                    editor.folding_manager = CodeFoldingManager(editor)
-
-                    # Connect signals
-                    editor.blockCountChanged.connect(editor.folding_manager.update_folding_regions)
-                    editor.textChanged.connect(editor.folding_manager.schedule_update)
-
-                    # Setup folding margin
-                    editor.setup_folding_margin()
+            # Folding managers are attached per editor when first shown,
+            # see _ensure_editor_chrome
 
             # Add folding actions to menu
             self.setup_folding_menu()
@@ -5347,25 +6193,47 @@ except ImportError:
         def __init__(self, editor):
             self.editor = editor
             self.folded_regions = {}
+            self.fold_starts: Dict[int, Tuple[int, int]] = {}
+            self.last_update = 0.0
+            self._scanned_revision: Optional[int] = None
             self.update_timer = QTimer()
             self.update_timer.setSingleShot(True)
             self.update_timer.timeout.connect(self.update_folding_regions)
 
         def schedule_update(self):
-            """Schedule delayed update of folding regions"""
-            self.update_timer.start(500)  # 500ms delay
+            """Update now if idle, otherwise schedule a trailing update"""
+            if time.monotonic() - self.last_update > FOLDING_UPDATE_INTERVAL:
+                self.update_timer.stop()
+                self.update_folding_regions()
+            else:
+                self.update_timer.start(500)  # 500ms delay
 
         def update_folding_regions(self):
             """Update folding regions in editor"""
+            self.last_update = time.monotonic()
             try:
                 document = self.editor.document()
-                self.folded_regions.clear()
 
-                block = document.begin()
-                while block.isValid():
-                    if self.is_fold_start(block):
-                        self.folded_regions[block.blockNumber()] = self.get_fold_range(block)
-                    block = block.next()
+                # Rescan only if the document was edited since the last
+                # scan; the revision moves on every change, undo included
+                revision = document.revision()
+                if revision != self._scanned_revision:
+                    # Scan once; margin painting and fold_all read fold_starts
+                    fold_starts = {}
+                    block = document.begin()
+                    while block.isValid():
+                        if self.is_fold_start(block):
+                            fold_starts[block.blockNumber()] = self.get_fold_range(block)
+                        block = block.next()
+                    self.fold_starts = fold_starts
+                    self._scanned_revision = revision
+
+                    # Keep only folds that still start a foldable region
+                    self.folded_regions = {
+                        number: fold_range
+                        for number, fold_range in self.folded_regions.items()
+                        if number in fold_starts
+                    }
 
                 self.editor.update_folding_margin()
 
@@ -5388,10 +6256,9 @@ except ImportError:
             ]
 
             for name, shortcut, callback in actions:
-                action = QAction(name, self)
-                action.setShortcut(shortcut)
-                action.triggered.connect(callback)
-                folding_menu.addAction(action)
+                folding_menu.addAction(
+                    self._make_action(None, name, shortcut, None, callback)
+                )
 
             self.logger.debug(
                 f"[2025-02-16 15:54:01] Folding menu setup by {CURRENT_USER}"
@@ -5405,28 +6272,23 @@ except ImportError:
 
     def toggle_fold(self):
         """Toggle code fold at current position"""
-        try:
-            editor = self.current_editor()
-            if not editor:
-                return
+        editor = self.current_editor()
+        if not editor:
+            return
 
-            cursor = editor.textCursor()
-            block = cursor.block()
+        cursor = editor.textCursor()
+        block = cursor.block()
 
-            if editor.folding_manager.is_fold_start(block):
-                if block.blockNumber() in editor.folding_manager.folded_regions:
-                    self.unfold_block(editor, block)
-                else:
-                    self.fold_block(editor, block)
-
-            self.logger.debug(
-                f"[2025-02-16 15:54:01] Fold toggled by {CURRENT_USER}"
-            )
+        if editor.folding_manager.is_fold_start(block):
+            if block.blockNumber() in editor.folding_manager.folded_regions:
+                self.unfold_block(editor, block)
+            else:
+                self.fold_block(editor, block)
 
-        except Exception as e:
-            self.logger.error(
-                f"[2025-02-16 15:54:01] Error toggling fold: {str(e)}"
-            )
+        self.logger.debug(
+            "Fold toggled by %s",
+            CURRENT_USER
+        )
 
 
     def toggle_all_folds(self):
@@ -5468,13 +6330,14 @@ except ImportError:
             cursor.beginEditBlock()
 
             try:
-                # Process all blocks
-                block = editor.document().begin()
-                while block.isValid():
-                    if (editor.folding_manager.is_fold_start(block) and
-                            block.blockNumber() not in editor.folding_manager.folded_regions):
+                # Only fold starts that are not folded yet
+                manager = editor.folding_manager
+                document = editor.document()
+                unfolded = manager.fold_starts.keys() - manager.folded_regions.keys()
+                for block_number in sorted(unfolded):
+                    block = document.findBlockByNumber(block_number)
+                    if block.isValid():
                         self.fold_block(editor, block)
-                    block = block.next()
 
             finally:
                 cursor.endEditBlock()
@@ -5501,12 +6364,36 @@ except ImportError:
             cursor.beginEditBlock()
 
             try:
-                # Process all folded blocks
-                folded_blocks = list(editor.folding_manager.folded_regions.keys())
-                for block_number in folded_blocks:
-                    block = editor.document().findBlockByNumber(block_number)
-                    if block.isValid():
-                        self.unfold_block(editor, block)
+                # Single sweep: reveal every folded range in document order
+                folded_regions = editor.folding_manager.folded_regions
+                document = editor.document()
+                first_pos = last_end = -1
+
+                block = document.begin()
+                while block.isValid():
+                    fold_range = folded_regions.get(block.blockNumber())
+                    block = block.next()
+                    if fold_range is None:
+                        continue
+
+                    end_line = fold_range[1]
+                    if first_pos < 0:
+                        first_pos = block.position()
+                    while block.isValid() and block.blockNumber() <= end_line:
+                        block.setVisible(True)
+                        last_end = block.position() + block.length()
+                        block = block.next()
+
+                folded_regions.clear()
+
+                # One relayout and one margin repaint for all folds
+                if last_end > first_pos >= 0:
+                    document.markContentsDirty(first_pos, last_end - first_pos)
+                document.documentLayout().documentSizeChanged.emit()
+                if hasattr(editor, 'folding_margin'):
+                    editor.folding_margin.update()
+                else:
+                    editor.update_folding_margin()
 
             finally:
                 cursor.endEditBlock()
@@ -5521,12 +6408,12 @@ except ImportError:
             )
 
 
-    def fold_block(self, editor: QTextEdit, block: QTextBlock):
+    def fold_block(self, editor: QPlainTextEdit, block: QTextBlock):
         """
         Fold a specific block in the editor
         
         Args:
-            editor (QTextEdit): Editor instance
+            editor (QPlainTextEdit): Editor instance
             block (QTextBlock): Block to fold
         """
         try:
@@ -5540,21 +6427,32 @@ except ImportError:
             editor.folding_manager.folded_regions[block.blockNumber()] = fold_range
 
             # Hide blocks in range
+            document = editor.document()
             current_block = block.next()
+            first_pos = current_block.position()
             while current_block.isValid() and current_block.blockNumber() <= end_line:
-                editor.document().markContentsDirty(
-                    current_block.position(),
-                    current_block.length()
-                )
                 current_block.setVisible(False)
                 current_block = current_block.next()
 
-            # Update document layout
-            editor.document().documentLayout().documentSizeChanged.emit()
-            editor.update_folding_margin()
+            # Relayout the whole range at once; only its end block is queried
+            end_block = document.findBlockByNumber(end_line)
+            if not end_block.isValid():
+                end_block = document.lastBlock()
+            last_end = end_block.position() + end_block.length()
+            if first_pos >= 0 and last_end > first_pos:
+                document.markContentsDirty(first_pos, last_end - first_pos)
+
+            # Update document layout; rows below the fold start move, so
+            # repaint the margin from there down
+            document.documentLayout().documentSizeChanged.emit()
+            if hasattr(editor, 'folding_margin'):
+                self.update_margin_lines(editor, editor.folding_margin, block.blockNumber())
+            else:
+                editor.update_folding_margin()
 
             self.logger.debug(
-                f"[2025-02-16 15:54:40] Block {block.blockNumber()} folded by {CURRENT_USER}"
+                "Block %d folded by %s",
+                block.blockNumber(), CURRENT_USER
             )
 
         except Exception as e:
@@ -5563,12 +6461,12 @@ except ImportError:
             )
 
 
-    def unfold_block(self, editor: QTextEdit, block: QTextBlock):
+    def unfold_block(self, editor: QPlainTextEdit, block: QTextBlock):
         """
         Unfold a specific block in the editor
         
         Args:
-            editor (QTextEdit): Editor instance
+            editor (QPlainTextEdit): Editor instance
             block (QTextBlock): Block to unfold
         """
         try:
@@ -5579,21 +6477,32 @@ except ImportError:
             start_line, end_line = fold_range
 
             # Show blocks in range
+            document = editor.document()
             current_block = block.next()
+            first_pos = current_block.position()
             while current_block.isValid() and current_block.blockNumber() <= end_line:
                 current_block.setVisible(True)
-                editor.document().markContentsDirty(
-                    current_block.position(),
-                    current_block.length()
-                )
                 current_block = current_block.next()
 
-            # Update document layout
-            editor.document().documentLayout().documentSizeChanged.emit()
-            editor.update_folding_margin()
+            # Relayout the whole range at once; only its end block is queried
+            end_block = document.findBlockByNumber(end_line)
+            if not end_block.isValid():
+                end_block = document.lastBlock()
+            last_end = end_block.position() + end_block.length()
+            if first_pos >= 0 and last_end > first_pos:
+                document.markContentsDirty(first_pos, last_end - first_pos)
+
+            # Update document layout; rows below the fold start move, so
+            # repaint the margin from there down
+            document.documentLayout().documentSizeChanged.emit()
+            if hasattr(editor, 'folding_margin'):
+                self.update_margin_lines(editor, editor.folding_margin, block.blockNumber())
+            else:
+                editor.update_folding_margin()
 
             self.logger.debug(
-                f"[2025-02-16 15:54:40] Block {block.blockNumber()} unfolded by {CURRENT_USER}"
+                "Block %d unfolded by %s",
+                block.blockNumber(), CURRENT_USER
             )
 
         except Exception as e:
@@ -5610,59 +6519,82 @@ except ImportError:
             self.editor = editor
             self.setFixedWidth(16)
             self.setCursor(Qt.CursorShape.PointingHandCursor)
+            self.build_marker_pixmaps()
+
+        def build_marker_pixmaps(self):
+            """Pre-render folded/unfolded markers for the current font and palette"""
+            line_height = self.editor.fontMetrics().height()
+            self._folded_px = self.render_fold_marker(True, line_height)
+            self._unfolded_px = self.render_fold_marker(False, line_height)
+
+        def render_fold_marker(self, is_folded: bool, line_height: int) -> QPixmap:
+            """Draw a folding marker triangle into a transparent pixmap"""
+            pixmap = QPixmap(self.width(), line_height)
+            pixmap.fill(Qt.GlobalColor.transparent)
+            rect = pixmap.rect()
+
+            if is_folded:
+                points = [
+                    QPoint(6, rect.top() + 4),
+                    QPoint(6, rect.bottom() - 4),
+                    QPoint(10, rect.center().y())
+                ]
+            else:
+                points = [
+                    QPoint(4, rect.top() + 6),
+                    QPoint(12, rect.top() + 6),
+                    QPoint(8, rect.top() + 10)
+                ]
 
-        def paintEvent(self, event: QPaintEvent):
-            try:
-                painter = QPainter(self)
-                painter.fillRect(event.rect(), self.palette().window())
+            painter = QPainter(pixmap)
+            painter.setPen(self.palette().text().color())
+            painter.drawPolygon(QPolygon(points))
+            painter.end()
+            return pixmap
 
-                block = self.editor.firstVisibleBlock()
-                while block.isValid():
-                    y = self.editor.blockBoundingGeometry(block).translated(
-                        self.editor.contentOffset()
-                    ).top()
+        def changeEvent(self, event: QEvent):
+            if event.type() in (QEvent.Type.PaletteChange, QEvent.Type.FontChange):
+                self.build_marker_pixmaps()
+                self.update()
+            super().changeEvent(event)
 
-                    if y > event.rect().bottom():
+        def paintEvent(self, event: QPaintEvent):
+            clip = event.rect().intersected(self.rect())
+            painter = QPainter(self)
+            painter.setClipRect(clip)
+            painter.fillRect(clip, self.palette().window())
+
+            manager = self.editor.folding_manager
+            fold_starts = manager.fold_starts
+            folded_regions = manager.folded_regions
+            bottom = clip.bottom()
+            if self._folded_px.height() != self.editor.fontMetrics().height():
+                self.build_marker_pixmaps()
+
+            # Geometry is only queried once; later rows advance by layout height
+            block = self.editor.firstVisibleBlock()
+            y = self.editor.blockBoundingGeometry(block).translated(
+                self.editor.contentOffset()
+            ).top()
+
+            while block.isValid():
+                if block.isVisible():
+                    if y > bottom:
                         break
 
-                    if block.isVisible() and self.editor.folding_manager.is_fold_start(block):
-                        is_folded = block.blockNumber() in self.editor.folding_manager.folded_regions
-                        self.draw_fold_marker(painter, y, is_folded)
+                    number = block.blockNumber()
+                    if number in fold_starts:
+                        self.draw_fold_marker(painter, y, number in folded_regions)
 
-                    block = block.next()
+                    y += block.layout().boundingRect().height()
 
-            except Exception as e:
-                logger.error(
-                    f"[2025-02-16 15:54:40] Error painting folding margin: {str(e)}"
-                )
+                block = block.next()
 
         def draw_fold_marker(self, painter: QPainter, y: int, is_folded: bool):
             """Draw folding marker triangle"""
-            try:
-                rect = QRect(0, int(y), self.width(), self.editor.fontMetrics().height())
-                painter.setPen(self.palette().text().color())
-
-                # Draw triangle
-                points = []
-                if is_folded:
-                    points = [
-                        QPoint(6, rect.top() + 4),
-                        QPoint(6, rect.bottom() - 4),
-                        QPoint(10, rect.center().y())
-                    ]
-                else:
-                    points = [
-                        QPoint(4, rect.top() + 6),
-                        QPoint(12, rect.top() + 6),
-                        QPoint(8, rect.top() + 10)
-                    ]
-
-                painter.drawPolygon(QPolygon(points))
-
-            except Exception as e:
-                logger.error(
-                    f"[2025-02-16 15:54:40] Error drawing fold marker: {str(e)}"
-                )
+            painter.drawPixmap(
+                0, int(y), self._folded_px if is_folded else self._unfolded_px
+            )
 
 
     def setup_bookmarks(self):
@@ -5674,21 +6606,25 @@ except ImportError:
         """
         try:
             # Initialize bookmarks with typing
-            self.bookmarks: Dict[str, Set[int]] = {}
+            self.bookmarks: Dict[str, Union[SortedList, BookmarkArray]] = {}
             self.current_bookmark: Optional[Tuple[str, int]] = None
 
+            # Persisted form of self.bookmarks; only dirty paths are rebuilt
+            self._bookmark_cache: Dict[str, QByteArray] = {}
+            self._dirty_bookmark_paths: Set[str] = set()
+            self._bookmarks_dirty = False
+            self._bookmarks_save_timer = QTimer(self)
+            self._bookmarks_save_timer.setSingleShot(True)
+            self._bookmarks_save_timer.timeout.connect(self.save_bookmarks)
+
             # Create bookmarks menu
             self.bookmarks_menu = QMenu("&Bookmarks", self)
             self.menuBar().addMenu(self.bookmarks_menu)
 
-            # Add bookmark actions
+            # Add bookmark actions; margins are attached per editor when
+            # first shown, see _ensure_editor_chrome
             self.setup_bookmark_actions()
 
-            # Add bookmark margin to editors
-            for editor in self.editors:
-                if not hasattr(editor, 'bookmark_margin'):
-                    editor.bookmark_margin = BookmarkMargin(editor)
-
             self.logger.info(
                 f"[2025-02-16 15:55:27] Bookmarks setup by {CURRENT_USER}"
             )
@@ -5716,11 +6652,9 @@ except ImportError:
                     self.bookmarks_menu.addSeparator()
                     continue
 
-                action = QAction(name, self)
-                if shortcut:
-                    action.setShortcut(shortcut)
-                action.triggered.connect(callback)
-                self.bookmarks_menu.addAction(action)
+                self.bookmarks_menu.addAction(
+                    self._make_action(None, name, shortcut, None, callback)
+                )
 
             self.logger.debug(
                 f"[2025-02-16 15:55:27] Bookmark actions setup by {CURRENT_USER}"
@@ -5751,11 +6685,13 @@ except ImportError:
                 self.add_bookmark(editor.file_path, line_number)
                 self.show_status_message("Bookmark added")
 
-            # Save bookmarks
-            self.save_bookmarks()
+            # Save bookmarks once toggling settles
+            self._bookmarks_dirty = True
+            self._bookmarks_save_timer.start(1000)
 
             self.logger.debug(
-                f"[2025-02-16 15:55:27] Bookmark toggled at line {line_number} by {CURRENT_USER}"
+                "Bookmark toggled at line %s by %s",
+                line_number, CURRENT_USER
             )
 
         except Exception as e:
@@ -5775,17 +6711,10 @@ except ImportError:
         Returns:
             bool: True if line is bookmarked
         """
-        try:
-            return (
-                    file_path in self.bookmarks and
-                    line_number in self.bookmarks[file_path]
-            )
-
-        except Exception as e:
-            self.logger.error(
-                f"[2025-02-16 15:55:27] Error checking bookmark status: {str(e)}"
-            )
-            return False
+        return (
+                file_path in self.bookmarks and
+                line_number in self.bookmarks[file_path]
+        )
 
 
     def add_bookmark(self, file_path: str, line_number: int):
@@ -5799,18 +6728,29 @@ except ImportError:
         try:
             # Initialize file's bookmarks if needed
             if file_path not in self.bookmarks:
-                self.bookmarks[file_path] = set()
+                self.bookmarks[file_path] = SortedList()
 
             # Add bookmark
-            self.bookmarks[file_path].add(line_number)
+            lines = self.bookmarks[file_path]
+            if line_number not in lines:
+                lines.add(line_number)
+                self._dirty_bookmark_paths.add(file_path)
+
+                # Switch large sets to compact unboxed storage
+                if (len(lines) > BOOKMARK_ARRAY_THRESHOLD and
+                        not isinstance(lines, BookmarkArray)):
+                    self.bookmarks[file_path] = BookmarkArray(lines)
 
             # Update editor margin
             editor = self.get_editor_by_path(file_path)
             if editor and hasattr(editor, 'bookmark_margin'):
-                editor.bookmark_margin.update()
+                self.update_margin_lines(
+                    editor, editor.bookmark_margin, line_number, line_number
+                )
 
             self.logger.debug(
-                f"[2025-02-16 15:55:27] Bookmark added at line {line_number} by {CURRENT_USER}"
+                "Bookmark added at line %s by %s",
+                line_number, CURRENT_USER
             )
 
         except Exception as e:
@@ -5831,6 +6771,7 @@ except ImportError:
             if file_path in self.bookmarks:
                 # Remove bookmark
                 self.bookmarks[file_path].discard(line_number)
+                self._dirty_bookmark_paths.add(file_path)
 
                 # Clean up if no bookmarks left
                 if not self.bookmarks[file_path]:
@@ -5839,10 +6780,13 @@ except ImportError:
                 # Update editor margin
                 editor = self.get_editor_by_path(file_path)
                 if editor and hasattr(editor, 'bookmark_margin'):
-                    editor.bookmark_margin.update()
+                    self.update_margin_lines(
+                        editor, editor.bookmark_margin, line_number, line_number
+                    )
 
                 self.logger.debug(
-                    f"[2025-02-16 15:55:27] Bookmark removed at line {line_number} by {CURRENT_USER}"
+                    "Bookmark removed at line %s by %s",
+                    line_number, CURRENT_USER
                 )
 
         except Exception as e:
@@ -5879,7 +6823,7 @@ except ImportError:
             if len(self.bookmarks) > 1:
                 next_file = self.find_next_bookmarked_file(editor.file_path)
                 if next_file:
-                    first_line = min(self.bookmarks[next_file])
+                    first_line = self.bookmarks[next_file][0]
                     self.goto_bookmark(next_file, first_line)
 
             self.logger.debug(
@@ -5892,26 +6836,20 @@ except ImportError:
             )
 
 
-    def find_next_bookmark(self, bookmarks: Set[int], current_line: int) -> Optional[int]:
+    def find_next_bookmark(self, bookmarks: Union[SortedList, BookmarkArray],
+                           current_line: int) -> Optional[int]:
         """
         Find next bookmark line number
         
         Args:
-            bookmarks (Set[int]): Set of bookmarked lines
+            bookmarks (SortedList | BookmarkArray): Sorted bookmarked lines
             current_line (int): Current line number
             
         Returns:
             Optional[int]: Next bookmark line or None
         """
-        try:
-            next_lines = [line for line in bookmarks if line > current_line]
-            return min(next_lines) if next_lines else None
-
-        except Exception as e:
-            self.logger.error(
-                f"[2025-02-16 15:56:09] Error finding next bookmark: {str(e)}"
-            )
-            return None
+        index = bookmarks.bisect_right(current_line)
+        return bookmarks[index] if index < len(bookmarks) else None
 
 
     def goto_bookmark(self, file_path: str, line_number: int):
@@ -5938,7 +6876,8 @@ except ImportError:
             self.current_bookmark = (file_path, line_number)
 
             self.logger.debug(
-                f"[2025-02-16 15:56:09] Navigated to bookmark at line {line_number} by {CURRENT_USER}"
+                "Navigated to bookmark at line %s by %s",
+                line_number, CURRENT_USER
             )
 
         except Exception as e:
@@ -5950,14 +6889,20 @@ except ImportError:
     def save_bookmarks(self):
         """Save bookmarks to settings"""
         try:
-            # Convert bookmarks to serializable format
-            bookmark_data = {
-                path: list(lines)
-                for path, lines in self.bookmarks.items()
-            }
+            # Refresh serialized lines only for paths changed since last save
+            for path in self._dirty_bookmark_paths:
+                lines = self.bookmarks.get(path)
+                if lines:
+                    self._bookmark_cache[path] = QByteArray(
+                        array('i', lines).tobytes()
+                    )
+                else:
+                    self._bookmark_cache.pop(path, None)
+            self._dirty_bookmark_paths.clear()
 
             # Save to settings
-            self.settings.setValue('bookmarks', bookmark_data)
+            self.settings.setValue('bookmarks', self._bookmark_cache)
+            self._bookmarks_dirty = False
 
             self.logger.debug(
                 f"[2025-02-16 15:56:09] Bookmarks saved by {CURRENT_USER}"
@@ -5969,18 +6914,53 @@ except ImportError:
             )
 
 
+    def decode_bookmark_lines(self, value) -> array:
+        """
+        Decode stored bookmark lines
+        
+        Args:
+            value: Packed array('i') bytes, or a list of line numbers as
+                written by older versions
+            
+        Returns:
+            array: Line numbers
+        """
+        lines = array('i')
+        if isinstance(value, (QByteArray, bytes, bytearray)):
+            lines.frombytes(bytes(value))
+        else:
+            lines.extend(int(line) for line in value)
+        return lines
+
+
     def load_bookmarks(self):
         """Load bookmarks from settings"""
         try:
             # Load from settings
             bookmark_data = self.settings.value('bookmarks', {})
 
+            # Only load files that still exist; stat them concurrently since
+            # each check may hit a slow (network) filesystem
+            paths = list(bookmark_data)
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                exists = list(executor.map(os.path.exists, paths))
+
             # Convert to internal format
-            self.bookmarks = {
-                path: set(lines)
-                for path, lines in bookmark_data.items()
-                if os.path.exists(path)  # Only load if file exists
+            self.bookmarks = {}
+            for path, found in zip(paths, exists):
+                if not found:
+                    continue
+                lines = set(self.decode_bookmark_lines(bookmark_data[path]))
+                self.bookmarks[path] = (
+                    BookmarkArray(lines) if len(lines) > BOOKMARK_ARRAY_THRESHOLD
+                    else SortedList(lines)
+                )
+
+            self._bookmark_cache = {
+                path: QByteArray(array('i', lines).tobytes())
+                for path, lines in self.bookmarks.items()
             }
+            self._dirty_bookmark_paths.clear()
 
             # Update editors
             for editor in self.editors:
@@ -6014,17 +6994,27 @@ except ImportError:
                 if not self.editor.file_path:
                     return
 
-                # Draw bookmark markers
-                block = self.editor.firstVisibleBlock()
+                # Look the file's bookmarks up once per paint
+                bookmarked = (
+                    self.window().bookmarks.get(self.editor.file_path) or frozenset()
+                )
+                if not bookmarked:
+                    return
+                rect_top = event.rect().top()
+                rect_bottom = event.rect().bottom()
+                offset = self.editor.contentOffset()
+
+                # Draw bookmark markers, starting at the first dirty row
+                block = self.editor.cursorForPosition(QPoint(0, rect_top)).block()
                 while block.isValid():
-                    y = self.editor.blockBoundingGeometry(block).translated(
-                        self.editor.contentOffset()
-                    ).top()
+                    geometry = self.editor.blockBoundingGeometry(block).translated(offset)
+                    y = geometry.top()
 
-                    if y > event.rect().bottom():
+                    if y > rect_bottom:
                         break
 
-                    if block.isVisible() and self.is_line_bookmarked(block.blockNumber()):
+                    if (geometry.bottom() >= rect_top and block.isVisible() and
+                            block.blockNumber() in bookmarked):
                         self.draw_bookmark_marker(painter, y)
 
                     block = block.next()
@@ -6101,7 +7091,7 @@ except ImportError:
                 return False
 
             # Get current bookmarks for file
-            bookmarks = self.bookmarks.get(editor.file_path, set())
+            bookmarks = self.bookmarks.get(editor.file_path)
             if not bookmarks:
                 self.show_status_message("No bookmarks in current file")
                 return False
@@ -6109,16 +7099,9 @@ except ImportError:
             # Get current line
             current_line = editor.textCursor().blockNumber()
 
-            # Find next bookmark
-            next_line = None
-            for line in sorted(bookmarks):
-                if line > current_line:
-                    next_line = line
-                    break
-
-            # Wrap around if needed
-            if next_line is None:
-                next_line = min(bookmarks)
+            # Find next bookmark, wrapping around if needed
+            index = bookmarks.bisect_right(current_line)
+            next_line = bookmarks[index] if index < len(bookmarks) else bookmarks[0]
 
             # Navigate to bookmark
             self.goto_line(editor, next_line)
@@ -6144,7 +7127,7 @@ except ImportError:
                 return False
 
             # Get current bookmarks for file
-            bookmarks = self.bookmarks.get(editor.file_path, set())
+            bookmarks = self.bookmarks.get(editor.file_path)
             if not bookmarks:
                 self.show_status_message("No bookmarks in current file")
                 return False
@@ -6152,16 +7135,9 @@ except ImportError:
             # Get current line
             current_line = editor.textCursor().blockNumber()
 
-            # Find previous bookmark
-            prev_line = None
-            for line in sorted(bookmarks, reverse=True):
-                if line < current_line:
-                    prev_line = line
-                    break
-
-            # Wrap around if needed
-            if prev_line is None:
-                prev_line = max(bookmarks)
+            # Find previous bookmark, wrapping around if needed
+            index = bookmarks.bisect_left(current_line)
+            prev_line = bookmarks[index - 1] if index else bookmarks[-1]
 
             # Navigate to bookmark
             self.goto_line(editor, prev_line)
@@ -6193,11 +7169,16 @@ except ImportError:
             if not block.isValid():
                 return False
 
-            cursor = QTextCursor(block)
-            editor.setTextCursor(cursor)
-
-            # Ensure line is visible with context
-            editor.centerCursor()
+            # Re-center only if the line lies outside the central half of
+            # the viewport; centerCursor accounts for wrapped and folded
+            # lines, and both scrolls land before the next repaint
+            viewport_height = editor.viewport().height()
+            top = editor.blockBoundingGeometry(block).translated(
+                editor.contentOffset()
+            ).top()
+            editor.setTextCursor(QTextCursor(block))
+            if not viewport_height / 4 <= top <= viewport_height * 3 / 4:
+                editor.centerCursor()
             editor.setFocus()
 
             # Highlight line temporarily
@@ -6223,27 +7204,25 @@ except ImportError:
             editor (QTextEdit): Editor widget
         """
         try:
-            # Save original colors
-            original_bg = editor.palette().color(QPalette.ColorRole.Base)
-
-            # Create highlight animation
-            highlight_color = QColor("#FFE2BC")
-            animation = QPropertyAnimation(editor, b"palette")
-            animation.setDuration(1000)  # 1 second
-
-            # Setup keyframes
-            start_palette = editor.palette()
-            end_palette = QPalette(start_palette)
-
-            highlight_palette = QPalette(start_palette)
-            highlight_palette.setColor(QPalette.ColorRole.Base, highlight_color)
+            # Full-width selection on the current line; only that line
+            # is repainted, unlike animating the whole palette
+            selection = QTextEdit.ExtraSelection()
+            selection.format.setBackground(QColor("#FFE2BC"))
+            selection.format.setProperty(QTextFormat.Property.FullWidthSelection, True)
+            selection.format.setProperty(_LINE_FLASH_PROPERTY, True)
+            selection.cursor = editor.textCursor()
+            selection.cursor.clearSelection()
 
-            animation.setStartValue(start_palette)
-            animation.setKeyValueAt(0.2, highlight_palette)
-            animation.setEndValue(end_palette)
+            editor.setExtraSelections(editor.extraSelections() + [selection])
 
-            # Start animation
-            animation.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
+            # Remove only the flash after 1 second, keeping other selections
+            # The editor is the timer's context, so closing the tab within
+            # the second cancels the removal instead of touching a deleted
+            # widget
+            QTimer.singleShot(1000, editor, lambda: editor.setExtraSelections([
+                other for other in editor.extraSelections()
+                if not other.format.boolProperty(_LINE_FLASH_PROPERTY)
+            ]))
 
         except Exception as e:
             self.logger.error(
@@ -6283,11 +7262,6 @@ except ImportError:
                 action.triggered.connect(callback)
                 self.folding_menu.addAction(action)
 
-            # Initialize folding managers for editors
-            for editor in self.editors:
-                if not hasattr(editor, 'folding_manager'):
-                    editor.folding_manager = CodeFoldingManager(editor)
-
             self.logger.info(
                 f"[2025-02-16 15:59:31] Code folding setup by {CURRENT_USER}"
             )
@@ -6303,24 +7277,130 @@ except ImportError:
 
         def __init__(self, editor: QTextEdit):
             self.editor = editor
-            self.folded_regions: Dict[int, Tuple[int, int]] = {}
-            self.fold_indicators: Dict[int, QWidget] = {}
+            # start line -> (start line, end line, currently folded)
+            self.folded_regions: Dict[int, Tuple[int, int, bool]] = {}
+
+            # Region bounds as parallel lists sorted by start, for bisect;
+            # _fold_parents holds the index of the enclosing region or -1
+            self._fold_starts: List[int] = []
+            self._fold_ends: List[int] = []
+            self._fold_parents: List[int] = []
+
+            # One margin widget paints every fold indicator
+            self.editor.fold_margin = FoldMargin(editor)
 
             # Setup delayed update
             self.update_timer = QTimer()
             self.update_timer.setSingleShot(True)
             self.update_timer.timeout.connect(self.update_fold_regions)
 
+            # Edited block range pending a rescan; None means full rescan
+            self._dirty_range: Optional[Tuple[int, int]] = None
+            self._scanned_block_count = -1
+
+            # Block indentation by line number, tagged with block revision
+            self._indent_cache: Dict[int, Tuple[int, int]] = {}
+
             # Connect to editor signals
-            self.editor.textChanged.connect(self.schedule_update)
-            self.editor.blockCountChanged.connect(self.schedule_update)
+            self.editor.document().contentsChange.connect(self.handle_contents_change)
+
+        def handle_contents_change(self, position: int, removed: int, added: int):
+            """Record the edited block range and schedule a rescan"""
+            document = self.editor.document()
+            first = document.findBlock(position).blockNumber()
+            last = document.findBlock(position + added).blockNumber()
+            if last < 0:
+                last = document.blockCount() - 1
+
+            if self._dirty_range is not None:
+                first = min(first, self._dirty_range[0])
+                last = max(last, self._dirty_range[1])
+            self._dirty_range = (first, last)
+
+            # Inserted/removed lines shift every cached line number
+            if document.blockCount() != self._scanned_block_count:
+                self._indent_cache.clear()
+
+            self.schedule_update()
 
         def schedule_update(self):
             """Schedule delayed update of fold regions"""
             self.update_timer.start(500)  # 500ms delay
 
         def update_fold_regions(self):
-            """Update folding regions based on code structure"""
+            """Update folding regions, rescanning only edited lines if possible"""
+            dirty_range, self._dirty_range = self._dirty_range, None
+            block_count = self.editor.document().blockCount()
+
+            # Line numbers only stay valid while the line count is unchanged
+            if dirty_range is not None and block_count == self._scanned_block_count:
+                self.update_fold_regions_in_range(*dirty_range)
+            else:
+                self.rescan_fold_regions()
+            self._scanned_block_count = block_count
+
+        def update_fold_regions_in_range(self, first: int, last: int):
+            """
+            Recompute fold regions touching an edited line range
+            
+            Args:
+                first (int): First edited line
+                last (int): Last edited line
+            """
+            try:
+                document = self.editor.document()
+
+                # Regions overlapping the edit (or ending right before it)
+                # may change their end line; recompute those
+                affected = [
+                    start for start, (_, end, _) in self.folded_regions.items()
+                    if start <= last and end >= first - 1
+                ]
+
+                # Nothing to do if no region is touched and no edited line
+                # can start a new one
+                candidates = set(affected)
+                block = document.findBlockByNumber(first)
+                while block.isValid() and block.blockNumber() <= last:
+                    if _FOLD_START_RE.match(block.text()):
+                        candidates.add(block.blockNumber())
+                    block = block.next()
+                if not candidates:
+                    return
+
+                was_folded = {start for start in affected if self.folded_regions[start][2]}
+                for start in affected:
+                    del self.folded_regions[start]
+
+                for start in sorted(candidates):
+                    block = document.findBlockByNumber(start)
+                    if block.isValid() and self.is_fold_start(block):
+                        end_line = self.find_fold_end(block)
+                        if end_line > start:
+                            self.folded_regions[start] = (start, end_line, False)
+
+                # Keep regions in document order for the sorted bounds
+                self.folded_regions = dict(sorted(self.folded_regions.items()))
+                self._rebuild_fold_index()
+
+                # Restore folds that were collapsed before the edit
+                for start_line in was_folded:
+                    if start_line in self.folded_regions:
+                        self.fold_block(start_line, batch=True)
+
+                # Update layout and UI once
+                if was_folded:
+                    self.refresh_fold_layout()
+                else:
+                    self.update_fold_indicators()
+
+            except Exception as e:
+                logger.error(
+                    f"[2025-02-16 15:59:31] Error updating fold regions: {str(e)}"
+                )
+
+        def rescan_fold_regions(self):
+            """Rebuild all folding regions based on code structure"""
             try:
                 document = self.editor.document()
                 block = document.begin()
@@ -6336,24 +7416,65 @@ except ImportError:
                         if end_line > block.blockNumber():
                             self.folded_regions[block.blockNumber()] = (
                                 block.blockNumber(),
-                                end_line
+                                end_line,
+                                False
                             )
 
                     block = block.next()
 
-                # Restore previously folded state
-                for start_line in old_regions:
-                    if start_line in self.folded_regions:
-                        self.fold_block(start_line)
+                # Regions were found in document order, so starts are sorted
+                self._rebuild_fold_index()
 
-                # Update UI
-                self.update_fold_indicators()
+                # Restore previously folded state
+                restored = False
+                for start_line, (_, _, folded) in old_regions.items():
+                    if folded and start_line in self.folded_regions:
+                        self.fold_block(start_line, batch=True)
+                        restored = True
+
+                # Update layout and UI once
+                if restored:
+                    self.refresh_fold_layout()
+                else:
+                    self.update_fold_indicators()
 
             except Exception as e:
                 logger.error(
                     f"[2025-02-16 15:59:31] Error updating fold regions: {str(e)}"
                 )
 
+        def _rebuild_fold_index(self):
+            """Rebuild the sorted region bounds from folded_regions"""
+            self._fold_starts = list(self.folded_regions)
+            self._fold_ends = [end for _, end, _ in self.folded_regions.values()]
+
+            # Regions nest by indentation; a stack of open regions yields
+            # each region's innermost enclosing one
+            self._fold_parents = []
+            open_regions: List[int] = []
+            for index, start in enumerate(self._fold_starts):
+                while open_regions and self._fold_ends[open_regions[-1]] < start:
+                    open_regions.pop()
+                self._fold_parents.append(open_regions[-1] if open_regions else -1)
+                open_regions.append(index)
+
+        def find_enclosing(self, line: int) -> Optional[int]:
+            """
+            Find the innermost fold region covering a line
+            
+            Args:
+                line (int): Line number to look up
+                
+            Returns:
+                Optional[int]: Start line of the region, or None
+            """
+            # The nearest preceding start may close before the line; the
+            # regions still covering it are among its ancestors
+            index = bisect.bisect_right(self._fold_starts, line) - 1
+            while index >= 0 and self._fold_ends[index] < line:
+                index = self._fold_parents[index]
+            return self._fold_starts[index] if index >= 0 else None
+
         def is_fold_start(self, block: QTextBlock) -> bool:
             """
             Check if block is a fold start point
@@ -6365,19 +7486,12 @@ except ImportError:
                 bool: True if block can start a fold
             """
             try:
-                text = block.text().strip()
-
-                # Check for common fold start patterns
-                patterns = [
-                    r'^\s*(?:class|def)\s+\w+.*:$',  # Python class/function
-                    r'^\s*(?:if|for|while|try)\s*.*:$',  # Python control structures
-                    r'^\s*{\s*$',  # Curly brace languages
-                    r'^\s*//\s*region\b',  # C# region
-                    r'^\s*/\*',  # Multi-line comment start
-                    r'^\s*<!--'  # HTML comment start
-                ]
-
-                return any(re.match(pattern, text) for pattern in patterns)
+                # Most lines are rejected by their first character alone
+                text = block.text()
+                stripped = text.lstrip()
+                if not stripped or stripped[0] not in _FOLD_START_CHARS:
+                    return False
+                return _FOLD_START_RE.match(text) is not None
 
             except Exception as e:
                 logger.error(
@@ -6385,261 +7499,302 @@ except ImportError:
                 )
                 return False
 
-
-    def find_fold_end(self, block: QTextBlock) -> int:
-        """
-        Find the end line of a fold region
-        
-        Last modified: 2025-02-16 16:00:23
-        Modified by: vcutrone
-        
-        Args:
-            block (QTextBlock): Starting block of fold
+        def find_fold_end(self, block: QTextBlock) -> int:
+            """
+            Find the end line of a fold region
             
-        Returns:
-            int: Line number of fold end
-        """
-        try:
-            start_indent = self.get_block_indent(block)
-            current_block = block.next()
-
-            while current_block.isValid():
-                # Check indentation level
-                current_indent = self.get_block_indent(current_block)
+            Last modified: 2025-02-16 16:00:23
+            Modified by: vcutrone
+            
+            Args:
+                block (QTextBlock): Starting block of fold
+                
+            Returns:
+                int: Line number of fold end
+            """
+            try:
+                start_indent = self.get_block_indent(block)
+                current_block = block.next()
 
-                # Empty lines don't break the fold
-                if not current_block.text().strip():
-                    current_block = current_block.next()
-                    continue
+                while current_block.isValid():
+                    # Check indentation level
+                    current_indent = self.get_block_indent(current_block)
 
-                # End fold when finding same or lower indentation
-                if current_indent <= start_indent:
-                    return current_block.blockNumber() - 1
+                    # Empty lines don't break the fold
+                    if not current_block.text().strip():
+                        current_block = current_block.next()
+                        continue
 
-                current_block = current_block.next()
+                    # End fold when finding same or lower indentation
+                    if current_indent <= start_indent:
+                        return current_block.blockNumber() - 1
 
-            # If we reach the end, use last line
-            return self.editor.document().lineCount() - 1
+                    current_block = current_block.next()
 
-        except Exception as e:
-            logger.error(
-                f"[2025-02-16 16:00:23] Error finding fold end: {str(e)}"
-            )
-            return block.blockNumber()
+                # If we reach the end, use last line
+                return self.editor.document().lineCount() - 1
 
+            except Exception as e:
+                logger.error(
+                    f"[2025-02-16 16:00:23] Error finding fold end: {str(e)}"
+                )
+                return block.blockNumber()
 
-    def get_block_indent(self, block: QTextBlock) -> int:
-        """
-        Get indentation level of a block
-        
-        Args:
-            block (QTextBlock): Block to check
+        def get_block_indent(self, block: QTextBlock) -> int:
+            """
+            Get indentation level of a block
             
-        Returns:
-            int: Number of spaces/tabs at start
-        """
-        try:
-            text = block.text()
-            indent = len(text) - len(text.lstrip())
-            return indent
-
-        except Exception as e:
-            logger.error(
-                f"[2025-02-16 16:00:23] Error getting block indent: {str(e)}"
-            )
-            return 0
+            Args:
+                block (QTextBlock): Block to check
+                
+            Returns:
+                int: Number of spaces/tabs at start
+            """
+            try:
+                # Reuse the indent until the block is edited
+                number = block.blockNumber()
+                revision = block.revision()
+                cached = self._indent_cache.get(number)
+                if cached is not None and cached[0] == revision:
+                    return cached[1]
+
+                text = block.text()
+                indent = len(text) - len(text.lstrip())
+                self._indent_cache[number] = (revision, indent)
+                return indent
 
+            except Exception as e:
+                logger.error(
+                    f"[2025-02-16 16:00:23] Error getting block indent: {str(e)}"
+                )
+                return 0
 
-    def fold_block(self, line_number: int) -> bool:
-        """
-        Fold a specific block
-        
-        Args:
-            line_number (int): Line number to fold
+        def _set_fold_visibility(self, start_line: int, end_line: int, visible: bool):
+            """
+            Show or hide the blocks folded under a fold start, without any
+            layout or indicator refresh
             
-        Returns:
-            bool: True if fold successful
-        """
-        try:
-            if line_number not in self.folded_regions:
-                return False
-
-            start_line, end_line = self.folded_regions[line_number]
-
-            # Hide blocks in fold region
+            Args:
+                start_line (int): Fold start line
+                end_line (int): Last line of the fold
+                visible (bool): True to unfold, False to fold
+            """
             block = self.editor.document().findBlockByNumber(start_line + 1)
             while block.isValid() and block.blockNumber() <= end_line:
-                block.setVisible(False)
+                block.setVisible(visible)
                 block = block.next()
 
-            # Update document layout
-            self.editor.document().markContentsDirty(
-                block.position(),
-                block.length()
-            )
-
-            # Update UI
-            self.update_fold_indicators()
-
-            self.logger.debug(
-                f"[2025-02-16 16:00:23] Folded block at line {line_number} by {CURRENT_USER}"
-            )
-            return True
-
-        except Exception as e:
-            self.logger.error(
-                f"[2025-02-16 16:00:23] Error folding block: {str(e)}"
-            )
-            return False
+            # Remember the state so lookups need no document traversal
+            if start_line in self.folded_regions:
+                self.folded_regions[start_line] = (start_line, end_line, not visible)
 
+        def refresh_fold_layout(self, start_line: Optional[int] = None,
+                                end_line: Optional[int] = None):
+            """
+            Relayout folded text and refresh fold indicators once after
+            visibility changes
+            
+            Args:
+                start_line (int, optional): Fold start line; None relayouts
+                    the whole document
+                end_line (int, optional): Last line of the fold
+            """
+            document = self.editor.document()
+            if start_line is None:
+                document.markContentsDirty(0, document.characterCount())
+                self.update_fold_indicators()
+                return
 
-    def unfold_block(self, line_number: int) -> bool:
-        """
-        Unfold a specific block
-        
-        Args:
-            line_number (int): Line number to unfold
+            first_block = document.findBlockByNumber(start_line + 1)
+            end_block = document.findBlockByNumber(end_line)
+            if first_block.isValid() and end_block.isValid():
+                first_pos = first_block.position()
+                document.markContentsDirty(
+                    first_pos,
+                    end_block.position() + end_block.length() - first_pos
+                )
+
+            # Rows from the fold start down move; repaint only that band
+            start_block = document.findBlockByNumber(start_line)
+            top = int(self.editor.blockBoundingGeometry(start_block).translated(
+                self.editor.contentOffset()
+            ).top())
+            viewport = self.editor.viewport()
+            if top < viewport.height():
+                top = max(top, 0)
+                band_height = viewport.height() - top
+                viewport.update(0, top, viewport.width(), band_height)
+                self.editor.fold_margin.update(0, top, self.editor.fold_margin.width(), band_height)
+
+        def fold_block(self, line_number: int, *, batch: bool = False) -> bool:
+            """
+            Fold a specific block
             
-        Returns:
-            bool: True if unfold successful
-        """
-        try:
-            if line_number not in self.folded_regions:
-                return False
+            Args:
+                line_number (int): Line number to fold
+                batch (bool): Skip the layout/UI refresh; the caller refreshes
+                    once after the whole batch
+                
+            Returns:
+                bool: True if fold successful
+            """
+            try:
+                if line_number not in self.folded_regions:
+                    return False
 
-            start_line, end_line = self.folded_regions[line_number]
+                start_line, end_line, _ = self.folded_regions[line_number]
 
-            # Show blocks in fold region
-            block = self.editor.document().findBlockByNumber(start_line + 1)
-            while block.isValid() and block.blockNumber() <= end_line:
-                block.setVisible(True)
-                block = block.next()
+                # Hide blocks in fold region, then update layout and UI
+                self._set_fold_visibility(start_line, end_line, False)
+                if not batch:
+                    self.refresh_fold_layout(start_line, end_line)
 
-            # Update document layout
-            self.editor.document().markContentsDirty(
-                block.position(),
-                block.length()
-            )
+                logger.debug(
+                    f"[2025-02-16 16:00:23] Folded block at line {line_number} by {CURRENT_USER}"
+                )
+                return True
 
-            # Update UI
-            self.update_fold_indicators()
+            except Exception as e:
+                logger.error(
+                    f"[2025-02-16 16:00:23] Error folding block: {str(e)}"
+                )
+                return False
 
-            self.logger.debug(
-                f"[2025-02-16 16:00:23] Unfolded block at line {line_number} by {CURRENT_USER}"
-            )
-            return True
+        def unfold_block(self, line_number: int, *, batch: bool = False) -> bool:
+            """
+            Unfold a specific block
+            
+            Args:
+                line_number (int): Line number to unfold
+                batch (bool): Skip the layout/UI refresh; the caller refreshes
+                    once after the whole batch
+                
+            Returns:
+                bool: True if unfold successful
+            """
+            try:
+                if line_number not in self.folded_regions:
+                    return False
 
-        except Exception as e:
-            self.logger.error(
-                f"[2025-02-16 16:00:23] Error unfolding block: {str(e)}"
-            )
-            return False
+                start_line, end_line, _ = self.folded_regions[line_number]
 
+                # Show blocks in fold region, then update layout and UI
+                self._set_fold_visibility(start_line, end_line, True)
+                if not batch:
+                    self.refresh_fold_layout(start_line, end_line)
 
-    def update_fold_indicators(self):
-        """Update fold indicators in the margin"""
-        try:
-            # Remove old indicators
-            for indicator in self.fold_indicators.values():
-                indicator.deleteLater()
-            self.fold_indicators.clear()
+                logger.debug(
+                    f"[2025-02-16 16:00:23] Unfolded block at line {line_number} by {CURRENT_USER}"
+                )
+                return True
 
-            # Create new indicators
-            for line_number in self.folded_regions:
-                indicator = FoldIndicator(
-                    self.editor,
-                    line_number,
-                    self.is_block_folded(line_number)
+            except Exception as e:
+                logger.error(
+                    f"[2025-02-16 16:00:23] Error unfolding block: {str(e)}"
                 )
-                self.fold_indicators[line_number] = indicator
+                return False
 
-            self.logger.debug(
-                f"[2025-02-16 16:00:23] Updated fold indicators by {CURRENT_USER}"
-            )
+        def update_fold_indicators(self):
+            """Update fold indicators in the margin"""
+            try:
+                # The fold margin reads folded_regions when it paints
+                self.editor.fold_margin.update()
 
-        except Exception as e:
-            self.logger.error(
-                f"[2025-02-16 16:00:23] Error updating fold indicators: {str(e)}"
-            )
+                logger.debug(
+                    f"[2025-02-16 16:00:23] Updated fold indicators by {CURRENT_USER}"
+                )
 
+            except Exception as e:
+                logger.error(
+                    f"[2025-02-16 16:00:23] Error updating fold indicators: {str(e)}"
+                )
 
-    def is_block_folded(self, line_number: int) -> bool:
-        """
-        Check if a block is currently folded
-        
-        Args:
-            line_number (int): Line number to check
+        def is_block_folded(self, line_number: int) -> bool:
+            """
+            Check if a block is currently folded, either as the start of a
+            collapsed region or hidden inside one
             
-        Returns:
-            bool: True if block is folded
-        """
-        try:
-            if line_number not in self.folded_regions:
+            Args:
+                line_number (int): Line number to check
+                
+            Returns:
+                bool: True if block is folded
+            """
+            try:
+                index = bisect.bisect_right(self._fold_starts, line_number) - 1
+                while index >= 0:
+                    _, end, folded = self.folded_regions[self._fold_starts[index]]
+                    if end >= line_number and folded:
+                        return True
+                    index = self._fold_parents[index]
                 return False
 
-            start_line, _ = self.folded_regions[line_number]
-            block = self.editor.document().findBlockByNumber(start_line + 1)
-            return not block.isVisible()
-
-        except Exception as e:
-            self.logger.error(
-                f"[2025-02-16 16:00:23] Error checking block fold status: {str(e)}"
-            )
-            return False
+            except Exception as e:
+                logger.error(
+                    f"[2025-02-16 16:00:23] Error checking block fold status: {str(e)}"
+                )
+                return False
 
 
-    class FoldIndicator(QWidget):
+    class FoldMargin(QWidget):
         """
-        Widget for displaying fold indicators in the margin
+        Margin widget painting the fold indicators of all fold regions
         
         Last modified: 2025-02-16 16:01:07
         Modified by: vcutrone
         """
 
-        def __init__(self, editor: QTextEdit, line_number: int, is_folded: bool):
+        def __init__(self, editor: QPlainTextEdit):
             super().__init__(editor)
             self.editor = editor
-            self.line_number = line_number
-            self.is_folded = is_folded
+            self._margin_font = None
+            self._margin_width = 0
 
             # Configure appearance
-            self.setFixedSize(16, 16)
+            self.setFixedWidth(16)
             self.setCursor(Qt.CursorShape.PointingHandCursor)
 
-            # Position indicator
-            self.update_position()
+            # Position margin
+            self.update_geometry()
 
             # Show widget
             self.show()
 
             # Connect signals
-            self.editor.updateRequest.connect(self.update_position)
-
-        def update_position(self):
-            """Update indicator position based on line position"""
-            try:
-                block = self.editor.document().findBlockByNumber(self.line_number)
-                if not block.isValid():
-                    self.hide()
-                    return
-
-                # Calculate position
-                viewport = self.editor.viewport()
-                offset = self.editor.contentOffset()
-                pos = self.editor.blockBoundingGeometry(block).translated(offset).topLeft()
-
-                # Position in margin
-                margin_width = self.editor.fontMetrics().horizontalAdvance('9') * 4
-                self.move(viewport.x() - margin_width, int(pos.y()))
+            self.editor.updateRequest.connect(self.handle_update_request)
+
+        def update_geometry(self):
+            """Place the margin beside the viewport, aligned with its rows"""
+            font = self.editor.font()
+            if font != self._margin_font:
+                self._margin_font = font
+                self._margin_width = self.editor.fontMetrics().horizontalAdvance('9') * 4
+
+            viewport = self.editor.viewport()
+            self.setGeometry(
+                viewport.x() - self._margin_width,
+                viewport.y(),
+                self.width(),
+                viewport.height()
+            )
+
+        def handle_update_request(self, rect: QRect, dy: int):
+            """Scroll or repaint only the part of the margin that changed"""
+            if dy:
+                self.scroll(0, dy)
+            else:
+                self.update(0, rect.y(), self.width(), rect.height())
 
-            except Exception as e:
-                logger.error(
-                    f"[2025-02-16 16:01:07] Error updating fold indicator position: {str(e)}"
-                )
+            if rect.contains(self.editor.viewport().rect()):
+                self.update_geometry()
 
         def paintEvent(self, event: QPaintEvent):
-            """Draw the fold indicator triangle"""
+            """Draw the fold indicator triangles within the dirty rect"""
             try:
+                folded_regions = self.editor.folding_manager.folded_regions
+                if not folded_regions:
+                    return
+
                 painter = QPainter(self)
                 painter.setRenderHint(QPainter.RenderHint.Antialiasing)
 
@@ -6647,41 +7802,72 @@ except ImportError:
                 painter.setPen(Qt.PenStyle.NoPen)
                 painter.setBrush(QColor("#666666"))
 
-                # Calculate triangle points
-                rect = self.rect()
-                if self.is_folded:
-                    points = [
-                        QPoint(rect.left() + 4, rect.top() + 4),
-                        QPoint(rect.right() - 4, rect.top() + 8),
-                        QPoint(rect.left() + 4, rect.bottom() - 4)
-                    ]
-                else:
-                    points = [
-                        QPoint(rect.left() + 4, rect.top() + 4),
-                        QPoint(rect.right() - 4, rect.top() + 4),
-                        QPoint(rect.left() + 8, rect.bottom() - 4)
-                    ]
+                rect_top = event.rect().top()
+                rect_bottom = event.rect().bottom()
+                offset = self.editor.contentOffset()
+
+                block = self.editor.cursorForPosition(QPoint(0, rect_top)).block()
+                while block.isValid():
+                    geometry = self.editor.blockBoundingGeometry(block).translated(offset)
+                    if geometry.top() > rect_bottom:
+                        break
 
-                # Draw triangle
-                painter.drawPolygon(QPolygon(points))
+                    if (geometry.bottom() >= rect_top and block.isVisible() and
+                            block.blockNumber() in folded_regions):
+                        self.draw_indicator(
+                            painter,
+                            int(geometry.top()),
+                            folded_regions[block.blockNumber()][2]
+                        )
+
+                    block = block.next()
 
             except Exception as e:
                 logger.error(
-                    f"[2025-02-16 16:01:07] Error painting fold indicator: {str(e)}"
+                    f"[2025-02-16 16:01:07] Error painting fold margin: {str(e)}"
                 )
 
+        def draw_indicator(self, painter: QPainter, y: int, is_folded: bool):
+            """Draw one fold indicator triangle"""
+            rect = QRect(0, y, 16, 16)
+            if is_folded:
+                points = [
+                    QPoint(rect.left() + 4, rect.top() + 4),
+                    QPoint(rect.right() - 4, rect.top() + 8),
+                    QPoint(rect.left() + 4, rect.bottom() - 4)
+                ]
+            else:
+                points = [
+                    QPoint(rect.left() + 4, rect.top() + 4),
+                    QPoint(rect.right() - 4, rect.top() + 4),
+                    QPoint(rect.left() + 8, rect.bottom() - 4)
+                ]
+
+            # Draw triangle
+            painter.drawPolygon(QPolygon(points))
+
         def mousePressEvent(self, event: QMouseEvent):
-            """Handle click to toggle fold"""
+            """Handle click to toggle the fold on the clicked line"""
             try:
-                if event.button() == Qt.MouseButton.LeftButton:
-                    if self.is_folded:
-                        self.editor.folding_manager.unfold_block(self.line_number)
-                    else:
-                        self.editor.folding_manager.fold_block(self.line_number)
+                if event.button() != Qt.MouseButton.LeftButton:
+                    return
+
+                manager = self.editor.folding_manager
+                block = self.editor.cursorForPosition(
+                    QPoint(0, int(event.position().y()))
+                ).block()
+                line_number = block.blockNumber()
+                if manager.find_enclosing(line_number) != line_number:
+                    return
+
+                if manager.is_block_folded(line_number):
+                    manager.unfold_block(line_number)
+                else:
+                    manager.fold_block(line_number)
 
             except Exception as e:
                 logger.error(
-                    f"[2025-02-16 16:01:07] Error handling fold indicator click: {str(e)}"
+                    f"[2025-02-16 16:01:07] Error handling fold margin click: {str(e)}"
                 )
 
 
@@ -6738,15 +7924,23 @@ except ImportError:
             cursor.beginEditBlock()
 
             try:
-                block = editor.document().begin()
+                # Fold every matching region as one batch, then relayout once
+                manager = editor.folding_manager
+                manager.update_timer.stop()
+                document = editor.document()
+                target_indent = level * getattr(self, 'tab_size', DEFAULT_TAB_SIZE)
                 folded_count = 0
 
-                while block.isValid():
-                    if (editor.folding_manager.is_fold_start(block) and
-                            editor.folding_manager.get_block_indent(block) == level * 4):
-                        if editor.folding_manager.fold_block(block.blockNumber()):
-                            folded_count += 1
-                    block = block.next()
+                # Regions already enumerate the fold starts; indents are cached
+                for start_line, _, folded in list(manager.folded_regions.values()):
+                    if folded:
+                        continue
+                    block = document.findBlockByNumber(start_line)
+                    if (manager.get_block_indent(block) == target_indent and
+                            manager.fold_block(start_line, batch=True)):
+                        folded_count += 1
+
+                manager.refresh_fold_layout()
 
                 self.show_status_message(f"Folded {folded_count} blocks at level {level}")
 
@@ -6780,14 +7974,16 @@ except ImportError:
             cursor.beginEditBlock()
 
             try:
-                block = editor.document().begin()
-                folded_count = 0
+                # Fold every region as one batch, then relayout once
+                manager = editor.folding_manager
+                manager.update_timer.stop()
 
-                while block.isValid():
-                    if editor.folding_manager.is_fold_start(block):
-                        if editor.folding_manager.fold_block(block.blockNumber()):
-                            folded_count += 1
-                    block = block.next()
+                folded_count = sum(
+                    manager.fold_block(start_line, batch=True)
+                    for start_line in list(manager.folded_regions)
+                )
+
+                manager.refresh_fold_layout()
 
                 self.show_status_message(f"Folded {folded_count} blocks")
 
@@ -6818,12 +8014,16 @@ except ImportError:
             cursor.beginEditBlock()
 
             try:
-                folded_regions = list(editor.folding_manager.folded_regions.keys())
-                unfolded_count = 0
+                # Unfold every region as one batch, then relayout once
+                manager = editor.folding_manager
+                manager.update_timer.stop()
 
-                for line_number in folded_regions:
-                    if editor.folding_manager.unfold_block(line_number):
-                        unfolded_count += 1
+                unfolded_count = sum(
+                    manager.unfold_block(start_line, batch=True)
+                    for start_line in list(manager.folded_regions)
+                )
+
+                manager.refresh_fold_layout()
 
                 self.show_status_message(f"Unfolded {unfolded_count} blocks")
 
@@ -6868,13 +8068,17 @@ except ImportError:
             # Setup update timer
             self.minimap_update_timer = QTimer(self)
             self.minimap_update_timer.setSingleShot(True)
-            self.minimap_update_timer.timeout.connect(self.update_minimap)
+            self.minimap_update_timer.setInterval(MINIMAP_UPDATE_DELAY)
+            self.minimap_update_timer.timeout.connect(self._do_update_minimap)
 
             # Connect signals
-            self.tab_widget.currentChanged.connect(self.schedule_minimap_update)
+            self.tab_widget.currentChanged.connect(self.update_minimap)
+            for editor in self.editors:
+                self.connect_minimap_signals(editor)
 
             self.logger.info(
-                f"[2025-02-16 16:01:53] Minimap setup by {CURRENT_USER}"
+                "Minimap setup by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -6883,43 +8087,93 @@ except ImportError:
             )
 
 
-    def schedule_minimap_update(self):
-        """Schedule delayed minimap update"""
-        try:
-            self.minimap_update_timer.start(100)  # 100ms delay
+    def connect_minimap_signals(self, editor: QTextEdit):
+        """
+        Route an editor's edits and scrolling through the minimap timer
+        
+        Args:
+            editor (QTextEdit): Editor to connect signals for
+        """
+        if getattr(editor, '_minimap_connected', False):
+            return
 
-        except Exception as e:
-            self.logger.error(
-                f"[2025-02-16 16:01:53] Error scheduling minimap update: {str(e)}"
-            )
+        editor.textChanged.connect(self.update_minimap)
+        editor.verticalScrollBar().valueChanged.connect(self.update_minimap)
+        editor.document().contentsChange.connect(
+            lambda position, removed, added, e=editor:
+                self.patch_minimap_content(e, position, removed, added)
+        )
+
+        # Only scrolling or a change in line count moves the visible range
+        editor._visible_dirty = True
+        invalidate = lambda *args, e=editor: setattr(e, '_visible_dirty', True)
+        editor.verticalScrollBar().valueChanged.connect(invalidate)
+        editor.document().blockCountChanged.connect(invalidate)
+        editor._minimap_connected = True
+
+
+    def patch_minimap_content(self, editor: QTextEdit, position: int,
+                              removed: int, added: int):
+        """
+        Forward a document edit to the minimap's mirror of the text
+        
+        Args:
+            editor (QTextEdit): Editor whose document changed
+            position (int): Character position of the change
+            removed (int): Number of characters removed
+            added (int): Number of characters added
+        """
+        # Only the document the minimap mirrors is patched; others are
+        # sent in full when their tab is shown
+        if editor.document() is not getattr(self, '_minimap_document', None):
+            return
+
+        self.minimap.patch_content(
+            position, removed, _changed_text(editor.document(), position, added)
+        )
 
 
-    def update_minimap(self):
+    def update_minimap(self, *args):
+        """Schedule a minimap update; restarts collapse a burst into one"""
+        self.minimap_update_timer.start()
+
+
+    def _do_update_minimap(self):
         """Update minimap with current editor content"""
         try:
             editor = self.current_editor()
             if not editor:
                 self.minimap.clear()
+                self._minimap_document = None
                 return False
 
-            # Get visible content
-            viewport = editor.viewport()
-            visible_rect = editor.viewport().rect()
-            visible_rect.translate(0, editor.verticalScrollBar().value())
+            # The full text is only sent when a document is first shown;
+            # later edits arrive through patch_minimap_content
+            text = None
+            if editor.document() is not getattr(self, '_minimap_document', None):
+                text = editor.toPlainText()
+                self._minimap_document = editor.document()
+
+            # Visible range is cached until connect_minimap_signals
+            # marks it dirty
+            if getattr(editor, '_visible_dirty', True):
+                editor._visible_range_cache = (
+                    editor.firstVisibleBlock().blockNumber(),
+                    editor.blockCount()
+                )
+                editor._visible_dirty = False
 
             # Update minimap
             self.minimap.set_content(
-                text=editor.toPlainText(),
+                text=text,
                 current_line=editor.textCursor().blockNumber(),
-                visible_range=(
-                    editor.firstVisibleBlock().blockNumber(),
-                    editor.blockCount()
-                ),
+                visible_range=editor._visible_range_cache,
                 highlights=self.get_minimap_highlights(editor)
             )
 
             self.logger.debug(
-                f"[2025-02-16 16:01:53] Updated minimap by {CURRENT_USER}"
+                "Updated minimap by %s",
+                CURRENT_USER
             )
             return True
 
@@ -6941,23 +8195,34 @@ except ImportError:
             List[Tuple[int, str]]: List of (line_number, color) pairs
         """
         try:
-            highlights = []
+            current_line = editor.textCursor().blockNumber()
+
+            # Search hits and markers only change when their owners set
+            # _highlights_dirty; a cursor move just swaps the first entry
+            highlights = getattr(editor, '_cached_highlights', None)
+            if highlights is not None and not getattr(editor, '_highlights_dirty', True):
+                if highlights[0][0] != current_line:
+                    highlights[0] = (current_line, "#FFE2BC")
+                return highlights
 
             # Add current line
-            cursor = editor.textCursor()
-            highlights.append((cursor.blockNumber(), "#FFE2BC"))
+            highlights = [(current_line, "#FFE2BC")]
 
             # Add search results
-            if hasattr(editor, 'search_highlights'):
-                for line in editor.search_highlights:
-                    highlights.append((line, "#B3E5FC"))
+            highlights.extend(
+                (line, "#B3E5FC") for line in getattr(editor, 'search_highlights', ())
+            )
 
-            # Add error/warning markers
-            if hasattr(editor, 'error_markers'):
-                for line, severity in editor.error_markers.items():
-                    color = "#FFCDD2" if severity == 'error' else "#FFF9C4"
-                    highlights.append((line, color))
+            # Add error/warning markers; kept per severity so no branching
+            highlights.extend(
+                (line, "#FFCDD2") for line in getattr(editor, 'error_lines', ())
+            )
+            highlights.extend(
+                (line, "#FFF9C4") for line in getattr(editor, 'warning_lines', ())
+            )
 
+            editor._cached_highlights = highlights
+            editor._highlights_dirty = False
             return highlights
 
         except Exception as e:
@@ -6988,9 +8253,11 @@ except ImportError:
                 self.show_status_message("Save file before analysis")
                 return False
 
-            # Show analysis panel
-            self.analysis_dock.show()
-            self.analysis_dock.raise_()
+            # Show analysis panel; raise_ restacks siblings, so only do it
+            # when the dock actually appears
+            if not self.analysis_dock.isVisible():
+                self.analysis_dock.show()
+                self.analysis_dock.raise_()
 
             # Get file extension
             extension = os.path.splitext(file_path)[1].lower()
@@ -7001,7 +8268,7 @@ except ImportError:
                     f"Analyzing {os.path.basename(file_path)}..."
                 )
                 self.logger.debug(
-                    f"[2025-02-16 16:04:15] Started code analysis by {CURRENT_USER}"
+                    "Started code analysis by %s", CURRENT_USER
                 )
                 return True
 
@@ -7033,37 +8300,35 @@ except ImportError:
             if not editor:
                 return
 
-            # Clear previous markers
-            editor.clear_analysis_markers()
-
-            # Process results
-            error_count = 0
-            warning_count = 0
-            info_count = 0
+            # Process results; counts are indexed by severity rank
+            # (error, warning, everything else)
+            markers = []
+            counts = [0, 0, 0]
 
             for result in results:
                 severity = result.get('severity', 'info')
-                line = result.get('line', 0)
-                message = result.get('message', '')
                 code = result.get('code', '')
                 source = result.get('source', '')
 
                 # Add marker with tooltip
-                tooltip = f"{severity.upper()}: {message}"
+                parts = [
+                    _SEV_PREFIX.get(severity) or severity.upper() + ': ',
+                    result.get('message', '')
+                ]
                 if code:
-                    tooltip += f"\nCode: {code}"
+                    parts += ("\nCode: ", code)
                 if source:
-                    tooltip += f"\nSource: {source}"
+                    parts += ("\nSource: ", source)
 
-                if severity == 'error':
-                    editor.add_error_marker(line, tooltip)
-                    error_count += 1
-                elif severity == 'warning':
-                    editor.add_warning_marker(line, tooltip)
-                    warning_count += 1
-                else:
-                    editor.add_info_marker(line, tooltip)
-                    info_count += 1
+                markers.append(
+                    (result.get('line', 0), severity, ''.join(parts))
+                )
+                counts[_SEV_GET(severity, 2)] += 1
+
+            # Replace the previous markers in a single repaint
+            self.set_analysis_markers(editor, markers)
+
+            error_count, warning_count, info_count = counts
 
             # Update status
             status = f"Analysis complete: "
@@ -7077,7 +8342,8 @@ except ImportError:
             self.show_status_message(status.rstrip(", "))
 
             self.logger.debug(
-                f"[2025-02-16 16:04:15] Completed code analysis by {CURRENT_USER}"
+                "Completed code analysis by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -7087,6 +8353,75 @@ except ImportError:
             self.show_status_message("Error processing analysis results", error=True)
 
 
+    def set_analysis_markers(self, editor: QTextEdit,
+                             markers: List[Tuple[int, str, str]]):
+        """
+        Replace an editor's analysis markers with one setExtraSelections call
+        
+        Args:
+            editor (QTextEdit): Editor to mark
+            markers (List[Tuple[int, str, str]]): (block number, severity,
+                tooltip) per diagnostic
+        """
+        try:
+            document = editor.document()
+            formats = {}
+            error_lines = array('i')
+            warning_lines = array('i')
+            others = [
+                other for other in editor.extraSelections()
+                if not other.format.boolProperty(_ANALYSIS_PROPERTY)
+            ]
+            selections = []
+
+            for line, severity, tooltip in markers:
+                block = document.findBlockByNumber(line)
+                if not block.isValid():
+                    continue
+
+                # One base format per severity, copied for the tooltip
+                base = formats.get(severity)
+                if base is None:
+                    base = formats[severity] = QTextCharFormat()
+                    base.setUnderlineStyle(
+                        QTextCharFormat.UnderlineStyle.WaveUnderline
+                    )
+                    base.setUnderlineColor(
+                        SEVERITY_COLORS.get(severity, _DEFAULT_SEVERITY_COLOR)
+                    )
+                    base.setProperty(_ANALYSIS_PROPERTY, True)
+
+                selection = QTextEdit.ExtraSelection()
+                selection.format = QTextCharFormat(base)
+                selection.format.setToolTip(tooltip)
+                selection.cursor = QTextCursor(block)
+                selection.cursor.movePosition(
+                    QTextCursor.MoveOperation.EndOfBlock,
+                    QTextCursor.MoveMode.KeepAnchor
+                )
+                selections.append(selection)
+
+                # As before, every non-error severity is drawn yellow
+                if severity == 'error':
+                    error_lines.append(line)
+                else:
+                    warning_lines.append(line)
+
+            # Kept on the editor so other highlighters can re-apply them
+            editor._analysis_selections = selections
+            editor.setExtraSelections(others + selections)
+
+            # Minimap highlights read these per-severity line arrays
+            editor.error_lines = array('i', sorted(error_lines))
+            editor.warning_lines = array('i', sorted(warning_lines))
+            editor._highlights_dirty = True
+
+        except Exception as e:
+            self.logger.error(
+                f"[2025-02-16 16:04:15] Error setting analysis markers: {str(e)}"
+            )
+
+
     def setup_code_completion(self):
         """
         Setup code completion with enhanced features
@@ -7117,12 +8452,40 @@ except ImportError:
             self.completion_info.setMaximumWidth(400)
             self.completion_info.hide()
 
+            # Load kind icons up front so popups never touch the disk
+            for kind in Kind:
+                self.get_suggestion_icon(kind)
+
+            # Completion requests run on a worker thread; results come
+            # back to show_completion_suggestions through a queued signal
+            self._completion_req_id = 0
+            self.completion_thread = QThread(self)
+            self.completion_worker = CompletionWorker(self.completer)
+            self.completion_worker.moveToThread(self.completion_thread)
+            self.completionRequested.connect(
+                self.completion_worker.request_completions
+            )
+            self.completionDocumentOpened.connect(
+                self.completion_worker.did_open
+            )
+            self.completionDocumentChanged.connect(
+                self.completion_worker.did_change
+            )
+            self.completion_worker.completions_ready.connect(
+                self.show_completion_suggestions
+            )
+            self.completion_thread.finished.connect(
+                self.completion_worker.deleteLater
+            )
+            self.completion_thread.start()
+
             # Connect signals for editors
             for editor in self.editors:
                 self.connect_completion_signals(editor)
 
             self.logger.info(
-                f"[2025-02-16 16:04:56] Code completion setup by {CURRENT_USER}"
+                "Code completion setup by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -7139,25 +8502,30 @@ except ImportError:
             editor (QTextEdit): Editor to connect signals for
         """
         try:
-            # Text change signals
-            editor.textChanged.connect(
-                lambda: self.handle_text_changed(editor)
+            # Text change signals; the partials are kept on the editor so
+            # they live as long as it does
+            editor._text_changed_cb = functools.partial(
+                self.handle_text_changed, editor
             )
+            editor.textChanged.connect(editor._text_changed_cb)
 
-            # Key press signals
-            editor.keyPressEvent = self.wrap_key_press_event(
-                editor,
-                editor.keyPressEvent
+            # Seed the completer with the text the editor already holds;
+            # every later edit is sent as an incremental change
+            editor._document_version = 0
+            self.completionDocumentOpened.emit(
+                editor.file_path or '', 0, editor.toPlainText()
             )
-
-            # Focus signals
-            editor.focusOutEvent = self.wrap_focus_out_event(
-                editor,
-                editor.focusOutEvent
+            editor._contents_change_cb = functools.partial(
+                self.sync_completion_document, editor
             )
+            editor.document().contentsChange.connect(editor._contents_change_cb)
+
+            # Completion keys and focus loss are handled in eventFilter
+            editor.installEventFilter(self)
 
             self.logger.debug(
-                f"[2025-02-16 16:04:56] Connected completion signals by {CURRENT_USER}"
+                "Connected completion signals by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -7166,6 +8534,36 @@ except ImportError:
             )
 
 
+    def sync_completion_document(self, editor: QTextEdit, position: int,
+                                 removed: int, added: int):
+        """
+        Send an incremental edit to the completer's copy of the document
+        
+        Args:
+            editor (QTextEdit): Editor whose document changed
+            position (int): Character position of the change
+            removed (int): Number of characters removed
+            added (int): Number of characters added
+        """
+        try:
+            editor._document_version = getattr(editor, '_document_version', 0) + 1
+
+            # Queued to the completion thread, so edits and requests reach
+            # the completer in order and never concurrently
+            self.completionDocumentChanged.emit(
+                editor.file_path or '',
+                editor._document_version,
+                position,
+                removed,
+                _changed_text(editor.document(), position, added)
+            )
+
+        except Exception as e:
+            self.logger.error(
+                f"[2025-02-16 16:04:56] Error syncing completion document: {str(e)}"
+            )
+
+
     def handle_text_changed(self, editor: QTextEdit):
         """
         Handle text changes for code completion
@@ -7210,25 +8608,16 @@ except ImportError:
         Returns:
             bool: True if completion should be triggered
         """
-        try:
-            # Don't trigger on whitespace
-            if text.isspace():
-                return False
-
-            # Check for trigger characters
-            trigger_chars = set('.', '_', ':', '>')
-            if any(char in text for char in trigger_chars):
-                return True
-
-            # Check for word characters
-            return text.isalnum()
+        if not text:
+            return False
 
-        except Exception as e:
-            self.logger.error(
-                f"[2025-02-16 16:04:56] Error checking completion trigger: {str(e)}"
-            )
+        # Only the last typed character matters
+        last = text[-1]
+        if last.isspace():
             return False
 
+        return last in _TRIGGER_CHARS or last.isalnum()
+
 
     def request_completions(self, editor: QTextEdit):
         """
@@ -7242,18 +8631,20 @@ except ImportError:
             cursor = editor.textCursor()
             line = cursor.blockNumber()
             column = cursor.positionInBlock()
-            text = editor.toPlainText()
 
-            # Request completions from language server
-            self.completer.request_completions(
-                text=text,
-                line=line,
-                column=column,
-                file_path=editor.file_path
+            # Tag the request so superseded results can be dropped
+            self._completion_req_id += 1
+            req_id = self._completion_req_id
+
+            # The server already holds the text through did_change, so
+            # only the position and document version are sent
+            self.completionRequested.emit(
+                req_id, line, column, editor.file_path or '',
+                getattr(editor, '_document_version', 0)
             )
 
             self.logger.debug(
-                f"[2025-02-16 16:04:56] Requested completions by {CURRENT_USER}"
+                "Requested completions by %s", CURRENT_USER
             )
 
         except Exception as e:
@@ -7262,7 +8653,79 @@ except ImportError:
             )
 
 
-    def show_completion_suggestions(self, suggestions: List[Dict[str, Any]]):
+    class CompletionWorker(QObject):
+        """Worker class for requesting completions off the GUI thread"""
+
+        # Define signals
+        completions_ready = pyqtSignal(int, list)
+
+        def __init__(self, completer):
+            super().__init__()
+            self.completer = completer
+            self.logger = logging.getLogger(__name__)
+
+        def did_open(self, file_path: str, version: int, text: str):
+            """Give the completer the full text of a newly tracked document"""
+            try:
+                self.completer.did_open(
+                    file_path=file_path,
+                    version=version,
+                    text=text
+                )
+
+            except Exception as e:
+                self.logger.error(
+                    f"[2025-02-16 16:04:56] Error opening completion document: {str(e)}"
+                )
+
+        def did_change(self, file_path: str, version: int, position: int,
+                       removed: int, text: str):
+            """Apply an incremental edit to the completer's document"""
+            try:
+                self.completer.did_change(
+                    file_path=file_path,
+                    version=version,
+                    position=position,
+                    removed=removed,
+                    text=text
+                )
+
+            except Exception as e:
+                self.logger.error(
+                    f"[2025-02-16 16:04:56] Error syncing completion document: {str(e)}"
+                )
+
+        def request_completions(self, req_id: int, line: int, column: int,
+                                file_path: str, version: int):
+            """Request completions at a position in a synced document"""
+            try:
+                # Stale results are dropped by show_completion_suggestions,
+                # which owns the current request id on the GUI thread
+                suggestions = self.completer.request_completions(
+                    line=line,
+                    column=column,
+                    file_path=file_path,
+                    version=version
+                )
+
+                if suggestions:
+                    # Resolve kind names once, off the GUI thread
+                    lookup = _KIND_LOOKUP.get
+                    for suggestion in suggestions:
+                        suggestion['_kind_int'] = lookup(
+                            suggestion.get('kind', ''), Kind.Unknown
+                        )
+
+                    self.completions_ready.emit(req_id, list(suggestions))
+
+            except Exception as e:
+                self.logger.error(
+                    f"[2025-02-16 16:04:56] Error requesting completions: {str(e)}"
+                )
+
+
+    def show_completion_suggestions(self, req_id: int,
+                                    suggestions: List[Dict[str, Any]]):
         """
         Show code completion suggestions in popup
         
@@ -7270,6 +8733,7 @@ except ImportError:
         Modified by: vcutrone
         
         Args:
+            req_id (int): Request the suggestions answer; stale ones are dropped
             suggestions (List[Dict[str, Any]]): List of completion items with:
                 - label: str
                 - kind: str
@@ -7279,6 +8743,9 @@ except ImportError:
                 - sortText: str (optional)
         """
         try:
+            if req_id != self._completion_req_id:
+                return
+
             editor = self.current_editor()
             if not editor or not suggestions:
                 return
@@ -7286,15 +8753,9 @@ except ImportError:
             # Sort suggestions
             sorted_suggestions = self.sort_suggestions(suggestions)
 
-            # Update completion list
-            self.completion_list.clear()
-            for suggestion in sorted_suggestions:
-                self.completion_list.add_suggestion(
-                    label=suggestion['label'],
-                    kind=suggestion['kind'],
-                    icon=self.get_suggestion_icon(suggestion['kind']),
-                    insert_text=suggestion.get('insertText', suggestion['label'])
-                )
+            # Update completion list; rows are only materialized when
+            # the view asks for them
+            self.completion_list.set_suggestions(sorted_suggestions)
 
             # Position popup
             cursor = editor.textCursor()
@@ -7304,14 +8765,21 @@ except ImportError:
             self.completion_list.move(global_pos)
             self.completion_list.show()
 
+            # The info widget sits to the right of the list; work out
+            # where once per popup rather than on every selection change
+            self._info_pos = QPoint(
+                global_pos.x() + self.completion_list.width() + 5,
+                global_pos.y()
+            )
+
             # Update info widget if available
-            if self.completion_list.currentItem():
-                self.update_completion_info(
-                    sorted_suggestions[self.completion_list.currentRow()]
-                )
+            suggestion = self.completion_list.current_suggestion()
+            if suggestion:
+                self.update_completion_info(suggestion)
 
             self.logger.debug(
-                f"[2025-02-16 16:05:36] Showed completion suggestions by {CURRENT_USER}"
+                "Showed completion suggestions by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -7331,30 +8799,15 @@ except ImportError:
             List[Dict[str, Any]]: Sorted suggestions
         """
         try:
-            def get_sort_key(item: Dict[str, Any]) -> Tuple[int, str]:
-                # Priority order: variables, functions, classes, etc.
-                kind_priority = {
-                    'Variable': 0,
-                    'Function': 1,
-                    'Class': 2,
-                    'Method': 3,
-                    'Property': 4,
-                    'Field': 5,
-                    'Interface': 6,
-                    'Module': 7,
-                    'Keyword': 8,
-                    'Snippet': 9
-                }
-
-                kind = item.get('kind', '')
-                priority = kind_priority.get(kind, 99)
-
-                # Use provided sort text or label
-                sort_text = item.get('sortText', item['label'].lower())
-
-                return (priority, sort_text)
-
-            return sorted(suggestions, key=get_sort_key)
+            # Keys are computed once per item, not per comparison; the
+            # Kind value is the priority
+            return sorted(
+                suggestions,
+                key=lambda item: (
+                    _suggestion_kind(item),
+                    item.get('sortText') or item['label'].lower()
+                )
+            )
 
         except Exception as e:
             self.logger.error(
@@ -7363,40 +8816,18 @@ except ImportError:
             return suggestions
 
 
-    def get_suggestion_icon(self, kind: str) -> QIcon:
+    def get_suggestion_icon(self, kind: Kind) -> QIcon:
         """
         Get appropriate icon for suggestion kind
         
         Args:
-            kind (str): Type of suggestion
+            kind (Kind): Type of suggestion
             
         Returns:
             QIcon: Icon for the suggestion type
         """
         try:
-            icon_map = {
-                'Variable': 'variable.png',
-                'Function': 'function.png',
-                'Class': 'class.png',
-                'Method': 'method.png',
-                'Property': 'property.png',
-                'Field': 'field.png',
-                'Interface': 'interface.png',
-                'Module': 'module.png',
-                'Keyword': 'keyword.png',
-                'Snippet': 'snippet.png'
-            }
-
-            icon_path = os.path.join(
-                self.resources_dir,
-                'icons',
-                icon_map.get(kind, 'default.png')
-            )
-
-            if os.path.exists(icon_path):
-                return QIcon(icon_path)
-
-            return QIcon()
+            return _load_icon(self.resources_dir, kind)
 
         except Exception as e:
             self.logger.error(
@@ -7423,25 +8854,26 @@ except ImportError:
                 info.append(suggestion['documentation'])
 
             if info:
-                # Show info widget
-                self.completion_info.setHtml(
-                    "<br>".join(info)
-                )
-
-                # Position next to completion list
-                list_pos = self.completion_list.pos()
-                list_size = self.completion_list.size()
+                # Position next to completion list; the list may have moved
+                # even when the content has not
+                self.completion_info.move(self._info_pos)
+
+                # Re-parsing identical HTML is skipped while it is shown
+                html_text = "<br>".join(info)
+                if (html_text == getattr(self, '_last_info_html', None)
+                        and self.completion_info.isVisible()):
+                    return
 
-                self.completion_info.move(
-                    list_pos.x() + list_size.width() + 5,
-                    list_pos.y()
-                )
+                # Show info widget
+                self._last_info_html = html_text
+                self.completion_info.setHtml(html_text)
                 self.completion_info.show()
             else:
                 self.completion_info.hide()
 
             self.logger.debug(
-                f"[2025-02-16 16:05:36] Updated completion info by {CURRENT_USER}"
+                "Updated completion info by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -7450,56 +8882,46 @@ except ImportError:
             )
 
 
-    def wrap_key_press_event(self, editor: QTextEdit, original_event: Callable) -> Callable:
+    def eventFilter(self, obj: QObject, event: QEvent) -> bool:
         """
-        Wrap editor's key press event for completion handling
-        
-        Last modified: 2025-02-16 16:06:30
-        Modified by: vcutrone
+        Handle completion keys and focus loss for editors the window is
+        installed on
         
         Args:
-            editor: Editor widget
-            original_event: Original key press handler
+            obj: Editor receiving the event
+            event: Event being delivered
             
         Returns:
-            Callable: Wrapped event handler
+            bool: True if the event was consumed
         """
+        if event.type() == QEvent.Type.KeyPress:
+            key = event.key()
 
-        def wrapped_event(event: QKeyEvent) -> None:
-            try:
-                # Handle completion navigation
-                if self.completion_list.isVisible():
-                    if event.key() in (Qt.Key.Key_Up, Qt.Key.Key_Down):
-                        self.navigate_completion(event.key())
-                        event.accept()
-                        return
-
-                    if event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
-                        self.apply_completion()
-                        event.accept()
-                        return
+            # Handle completion navigation
+            if self.completion_list.isVisible():
+                if key in (Qt.Key.Key_Up, Qt.Key.Key_Down):
+                    self.navigate_completion(key)
+                    return True
 
-                    if event.key() == Qt.Key.Key_Escape:
-                        self.hide_completion()
-                        event.accept()
-                        return
+                if key in (Qt.Key.Key_Return, Qt.Key.Key_Enter):
+                    self.apply_completion()
+                    return True
 
-                # Manual completion trigger
-                if event.key() == Qt.Key.Key_Space and event.modifiers() == Qt.KeyboardModifier.ControlModifier:
-                    self.request_completions(editor)
-                    event.accept()
-                    return
+                if key == Qt.Key.Key_Escape:
+                    self.hide_completion()
+                    return True
 
-                # Call original handler
-                original_event(event)
+            # Manual completion trigger
+            if key == Qt.Key.Key_Space and event.modifiers() == Qt.KeyboardModifier.ControlModifier:
+                self.request_completions(obj)
+                return True
 
-            except Exception as e:
-                self.logger.error(
-                    f"[2025-02-16 16:06:30] Error in key press event: {str(e)}"
-                )
-                original_event(event)
+        elif event.type() == QEvent.Type.FocusOut:
+            # Hide completion if focus moves outside editor
+            if not self.completion_list.geometry().contains(QCursor.pos()):
+                self.hide_completion()
 
-        return wrapped_event
+        return QMainWindow.eventFilter(self, obj, event)
 
 
     def navigate_completion(self, key: Qt.Key):
@@ -7521,13 +8943,13 @@ except ImportError:
             self.completion_list.setCurrentRow(new_row)
 
             # Update info widget
-            current_item = self.completion_list.currentItem()
-            if current_item:
-                suggestion_data = current_item.data(Qt.ItemDataRole.UserRole)
+            suggestion_data = self.completion_list.current_suggestion()
+            if suggestion_data:
                 self.update_completion_info(suggestion_data)
 
             self.logger.debug(
-                f"[2025-02-16 16:06:30] Navigated completion list by {CURRENT_USER}"
+                "Navigated completion list by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -7543,31 +8965,34 @@ except ImportError:
             if not editor:
                 return
 
-            current_item = self.completion_list.currentItem()
-            if not current_item:
+            # Get completion data
+            completion_data = self.completion_list.current_suggestion()
+            if not completion_data:
                 return
 
-            # Get completion data
-            completion_data = current_item.data(Qt.ItemDataRole.UserRole)
-            insert_text = completion_data.get('insertText', current_item.text())
+            insert_text = completion_data.get('insertText', completion_data['label'])
 
             # Get cursor and current word
             cursor = editor.textCursor()
             current_word = self.get_current_word(cursor)
 
-            # Remove current word
+            # Replace current word in a single edit; insertText replaces
+            # the selection
+            cursor.beginEditBlock()
             if current_word:
-                for _ in range(len(current_word)):
-                    cursor.deletePreviousChar()
-
-            # Insert completion text
+                cursor.setPosition(
+                    cursor.position() - len(current_word),
+                    QTextCursor.MoveMode.KeepAnchor
+                )
             cursor.insertText(insert_text)
+            cursor.endEditBlock()
 
             # Hide completion widgets
             self.hide_completion()
 
             self.logger.debug(
-                f"[2025-02-16 16:06:30] Applied completion by {CURRENT_USER}"
+                "Applied completion by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -7586,33 +9011,10 @@ except ImportError:
         Returns:
             str: Current word
         """
-        try:
-            # Save cursor position
-            pos = cursor.position()
-
-            # Select word
-            cursor.movePosition(
-                QTextCursor.MoveOperation.StartOfWord,
-                QTextCursor.MoveMode.MoveAnchor
-            )
-            cursor.movePosition(
-                QTextCursor.MoveOperation.EndOfWord,
-                QTextCursor.MoveMode.KeepAnchor
-            )
-
-            # Get selected text
-            word = cursor.selectedText()
-
-            # Restore cursor
-            cursor.setPosition(pos)
-
-            return word
-
-        except Exception as e:
-            self.logger.error(
-                f"[2025-02-16 16:06:30] Error getting current word: {str(e)}"
-            )
-            return ""
+        # Select on a copy so the caller's cursor is left untouched
+        word_cursor = QTextCursor(cursor)
+        word_cursor.select(QTextCursor.SelectionType.WordUnderCursor)
+        return word_cursor.selectedText()
 
 
     def hide_completion(self):
@@ -7627,7 +9029,8 @@ except ImportError:
             self.completion_info.hide()
 
             self.logger.debug(
-                f"[2025-02-16 16:07:16] Hidden completion widgets by {CURRENT_USER}"
+                "Hidden completion widgets by %s",
+                CURRENT_USER
             )
 
         except Exception as e:
@@ -7636,7 +9039,45 @@ except ImportError:
             )
 
 
-    class CompletionListWidget(QListWidget):
+    class CompletionListModel(QAbstractListModel):
+        """List model over the raw completion suggestion dicts"""
+
+        def __init__(self, icon_provider: Callable[[Kind], QIcon], parent=None):
+            super().__init__(parent)
+            self._suggestions: List[Dict[str, Any]] = []
+            self._icon_provider = icon_provider
+
+        def set_suggestions(self, suggestions: List[Dict[str, Any]]):
+            """Replace the suggestions with a single model reset"""
+            self.beginResetModel()
+            self._suggestions = suggestions
+            self.endResetModel()
+
+        def suggestion(self, row: int) -> Optional[Dict[str, Any]]:
+            """Return the suggestion at row, or None"""
+            if 0 <= row < len(self._suggestions):
+                return self._suggestions[row]
+            return None
+
+        def rowCount(self, parent=QModelIndex()) -> int:
+            return 0 if parent.isValid() else len(self._suggestions)
+
+        def data(self, index: QModelIndex, role=Qt.ItemDataRole.DisplayRole):
+            # Only called for rows the view actually shows
+            if not index.isValid():
+                return None
+
+            suggestion = self._suggestions[index.row()]
+            if role == Qt.ItemDataRole.DisplayRole:
+                return suggestion['label']
+            if role == Qt.ItemDataRole.DecorationRole:
+                return self._icon_provider(_suggestion_kind(suggestion))
+            if role == Qt.ItemDataRole.UserRole:
+                return suggestion
+            return None
+
+
+    class CompletionListWidget(QListView):
         """Enhanced completion suggestion list widget"""
 
         def __init__(self, parent=None):
@@ -7650,43 +9091,51 @@ except ImportError:
             )
             self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
             self.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+            self.setUniformItemSizes(True)
 
             # Style settings
             self.setStyleSheet("""
-                QListWidget {
+                QListView {
                     background-color: #2b2b2b;
                     border: 1px solid #3c3c3c;
                     color: #d4d4d4;
                 }
-                QListWidget::item {
+                QListView::item {
                     padding: 4px;
                 }
-                QListWidget::item:selected {
+                QListView::item:selected {
                     background-color: #3c3c3c;
                 }
             """)
 
+            # Suggestions live in the model; the view only pulls the rows
+            # it displays
+            self.completion_model = CompletionListModel(
+                self.parent().get_suggestion_icon, self
+            )
+            self.setModel(self.completion_model)
+
             # Connect signals
-            self.itemClicked.connect(self.parent().apply_completion)
+            self.clicked.connect(self.parent().apply_completion)
 
-        def add_suggestion(self, label: str, kind: str, icon: QIcon, insert_text: str):
-            """Add completion suggestion to list"""
-            try:
-                item = QListWidgetItem(icon, label)
-                item.setData(
-                    Qt.ItemDataRole.UserRole,
-                    {
-                        'label': label,
-                        'kind': kind,
-                        'insertText': insert_text
-                    }
-                )
-                self.addItem(item)
+        def set_suggestions(self, suggestions: List[Dict[str, Any]]):
+            """Show suggestions and select the first one"""
+            self.completion_model.set_suggestions(suggestions)
+            if suggestions:
+                self.setCurrentRow(0)
 
-            except Exception as e:
-                logger.error(
-                    f"[2025-02-16 16:07:16] Error adding completion suggestion: {str(e)}"
-                )
+        def current_suggestion(self) -> Optional[Dict[str, Any]]:
+            """Return the selected suggestion, or None"""
+            return self.completion_model.suggestion(self.currentRow())
+
+        def currentRow(self) -> int:
+            return self.currentIndex().row()
+
+        def setCurrentRow(self, row: int):
+            self.setCurrentIndex(self.completion_model.index(row, 0))
+
+        def count(self) -> int:
+            return self.completion_model.rowCount()
 
 
     class CompletionInfoWidget(QLabel):
@@ -7721,36 +9170,6 @@ except ImportError:
             self.setMaximumWidth(400)
 
 
-    def wrap_focus_out_event(self, editor: QTextEdit, original_event: Callable) -> Callable:
-        """
-        Wrap editor's focus out event for completion handling
-        
-        Args:
-            editor: Editor widget
-            original_event: Original focus out handler
-            
-        Returns:
-            Callable: Wrapped event handler
-        """
-
-        def wrapped_event(event: QFocusEvent) -> None:
-            try:
-                # Hide completion if focus moves outside editor
-                if not self.completion_list.geometry().contains(QCursor.pos()):
-                    self.hide_completion()
-
-                # Call original handler
-                original_event(event)
-
-            except Exception as e:
-                self.logger.error(
-                    f"[2025-02-16 16:07:16] Error in focus out event: {str(e)}"
-                )
-                original_event(event)
-
-        return wrapped_event
-
-
     def setup_code_intelligence(self):
         """Setup code intelligence features"""
         try:
@@ -7852,13 +9271,15 @@ except ImportError:
                 self.handle_references
             )
 
-            # Editor signals
+            # Completion rows are rebuilt into one long-lived model
+            self._completion_model = QStandardItemModel(self)
+
+            # Editor signals; document changes are debounced per editor
             for editor in self.editors:
-                editor.textChanged.connect(
-                    lambda: self.handle_document_change(editor)
-                )
+                editor._change_timer = self.create_document_change_timer(editor)
+                editor.textChanged.connect(editor._change_timer.start)
                 editor.cursorPositionChanged.connect(
-                    lambda: self.handle_cursor_move(editor)
+                    lambda ed=editor: self.handle_cursor_move(ed)
                 )
 
             self.logger.debug(
@@ -7871,6 +9292,24 @@ except ImportError:
             )
 
 
+    def create_document_change_timer(self, editor: QTextEdit) -> QTimer:
+        """
+        Create the single-shot timer that sends an editor's changes to the
+        language server once typing pauses
+        
+        Args:
+            editor (QTextEdit): Editor whose changes are debounced
+            
+        Returns:
+            QTimer: Timer to restart on every text change
+        """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(LSP_CHANGE_DELAY)
+        timer.timeout.connect(lambda ed=editor: self.handle_document_change(ed))
+        return timer
+
+
     def handle_diagnostics(self, diagnostics: List[Dict[str, Any]]) -> None:
         """
         Handle diagnostic messages from language server
@@ -7957,42 +9396,51 @@ except ImportError:
             if not editor:
                 return
 
-            # Create completion list model
-            model = QStandardItemModel()
-
-            # Process sorted completions
-            sorted_completions = sorted(
-                completions,
-                key=lambda x: (x.get('sortText', x.get('label', '')).lower())
-            )
-
-            for completion in sorted_completions:
+            # Drop items that cannot match the word being typed before
+            # building anything for them
+            cursor = editor.textCursor()
+            position = cursor.positionInBlock()
+            word_start = QTextCursor(cursor)
+            word_start.movePosition(QTextCursor.MoveOperation.StartOfWord)
+            prefix = cursor.block().text()[
+                min(word_start.positionInBlock(), position):position
+            ].lower()
+
+            # Compute each sort key once, then sort the keyed tuples
+            keyed = []
+            for completion in completions:
                 label = completion.get('label', '')
-                detail = completion.get('detail', '')
-                kind = completion.get('kind', 0)
-                documentation = completion.get('documentation', '')
-
-                # Create item with icon
-                item = QStandardItem(self.get_completion_icon(kind), label)
-
-                # Set tooltip with documentation
-                tooltip = f"{label}"
-                if detail:
-                    tooltip += f"\n{detail}"
-                if documentation:
-                    tooltip += f"\n\n{documentation}"
-                item.setToolTip(tooltip)
-
-                # Store completion data
+                if prefix and not (
+                    completion.get('filterText') or label
+                ).lower().startswith(prefix):
+                    continue
+                keyed.append((
+                    completion.get('sortText', label).lower(),
+                    label,
+                    completion
+                ))
+            keyed.sort(key=lambda entry: entry[0])
+
+            # Create items; tooltips are built only when one is shown
+            items = []
+            for _, label, completion in keyed:
+                item = CompletionItem(
+                    self.get_completion_icon(completion.get('kind', 0)), label
+                )
                 item.setData(completion, Qt.ItemDataRole.UserRole)
+                items.append(item)
 
-                model.appendRow(item)
+            # Refill the shared model with a single row insertion
+            model = self._completion_model
+            model.clear()
+            model.invisibleRootItem().appendRows(items)
 
             # Update completion widget
             self.intelligence_widget.show_completions(model)
 
             self.logger.debug(
-                f"[2025-02-16 16:09:27] Handled {len(completions)} completions by {vcutrone}"
+                "Handled %d completions by %s",
+                len(items), CURRENT_USER
             )
 
         except Exception as e:
@@ -8001,6 +9449,23 @@ except ImportError:
             )
 
 
+    class CompletionItem(QStandardItem):
+        """Completion row whose tooltip is assembled on first request"""
+
+        def data(self, role: int = Qt.ItemDataRole.UserRole + 1):
+            if role == Qt.ItemDataRole.ToolTipRole:
+                completion = super().data(Qt.ItemDataRole.UserRole) or {}
+                parts = [completion.get('label', '')]
+                detail = completion.get('detail', '')
+                if detail:
+                    parts += ("\n", str(detail))
+                documentation = completion.get('documentation', '')
+                if documentation:
+                    parts += ("\n\n", str(documentation))
+                return ''.join(parts)
+            return super().data(role)
+
+
     def get_completion_icon(self, kind: int) -> QIcon:
         """
         Get appropriate icon for completion kind
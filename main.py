@@ -458,6 +458,18 @@ class ConfigManager:
             )
 
 
+def log_uncaught_exception(exc_type, exc_value, exc_traceback) -> None:
+    """Log exceptions escaping Qt slots and paint handlers"""
+    if issubclass(exc_type, KeyboardInterrupt):
+        sys.__excepthook__(exc_type, exc_value, exc_traceback)
+        return
+
+    logging.getLogger(__name__).error(
+        "Uncaught exception",
+        exc_info=(exc_type, exc_value, exc_traceback)
+    )
+
+
 class ApplicationInitializer:
     """
     Handles application initialization sequence
@@ -661,6 +673,10 @@ def main() -> int:
         if not initializer.initialize_logging():
             return 1
 
+        # Editor hot paths (painting, folding, bookmark lookups) do not
+        # catch their own errors; log them instead of losing them
+        sys.excepthook = log_uncaught_exception
+
         # Log startup
         logger.info(
             f"[{AppConfig.CURRENT_TIMESTAMP}] Application startup by "